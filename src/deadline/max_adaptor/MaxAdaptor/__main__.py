@@ -29,5 +29,4 @@ def main(reentry_exe=None) -> int:
 
 
 if __name__ == "__main__":
-    main()
     sys.exit(main())
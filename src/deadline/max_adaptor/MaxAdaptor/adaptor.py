@@ -6,6 +6,7 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import re
@@ -32,8 +33,65 @@ class MaxNotRunningError(Exception):
 
 
 # Renderer needs extra steps
-_FIRST_MAX_ACTIONS = ["scene_file", "state_set"]  # Actions which must be queued before any others
-_MAX_INIT_KEYS = {"camera", "output_file_path", "output_file_name", "output_file_format"}
+_FIRST_MAX_ACTIONS = ("scene_file", "state_set")  # Actions which must be queued before any others
+# Ordered so the output path is bound before the name/format that refine it
+_MAX_INIT_KEYS = ("output_file_path", "output_file_name", "output_file_format", "camera")
+
+# Stdout patterns, compiled once at import time.
+# The error pattern is an alternation of plain literals: re.search already scans the whole
+# line, and wrapping the literals in ".*" only adds backtracking on long lines.
+_COMPLETED_RE = (re.compile(r"^MaxClient: Finished Rendering Frame (\d+)"),)
+_PROGRESS_RE = (re.compile(r"^\[PROGRESS\] (\d+) percent"),)
+_ERROR_RES = (re.compile("Exception:|Error:|Warning"),)
+
+
+@functools.lru_cache(maxsize=None)
+def _data_validators(schema_dir: str) -> AdaptorDataValidators:
+    """
+    Builds the init/run data validators for the given schema directory once per
+    process. for_adaptor re-reads the schema files and recompiles the JSON Schemas
+    on every call, which on_start and on_run would otherwise each pay per task.
+    """
+    return AdaptorDataValidators.for_adaptor(schema_dir)
+
+
+class _NotifyingActionsQueue(ActionsQueue):
+    """
+    ActionsQueue that signals an Event whenever the queue drains, so that waiters can block
+    on the event instead of polling the queue length.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.empty_event = threading.Event()
+        self.empty_event.set()
+
+    def enqueue_action(self, a: Action, front: bool = False) -> None:
+        self.empty_event.clear()
+        super().enqueue_action(a, front)
+
+    def dequeue_action(self) -> Action | None:
+        action = super().dequeue_action()
+        if len(self) == 0:
+            self.empty_event.set()
+        return action
+
+
+class _PrefilteredRegexCallback(RegexCallback):
+    """
+    RegexCallback that only runs its regexes when the line contains one of a set of literal
+    keywords. A plain substring test is a vectorized C-level scan, so the regex engine is
+    skipped entirely on the overwhelmingly common case of lines without any keyword.
+    """
+
+    def __init__(self, keywords: tuple[str, ...], *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._keywords = keywords
+
+    def get_match(self, msg: str) -> re.Match | None:
+        if not any(keyword in msg for keyword in self._keywords):
+            return None
+        return super().get_match(msg)
 
 
 def _check_for_exception(func: Callable) -> Callable:
@@ -61,13 +119,19 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
     _server: AdaptorServer | None = None
     _server_thread: threading.Thread | None = None
     _max_client: LoggingSubprocess | None = None
-    _action_queue = ActionsQueue()
+    _action_queue = _NotifyingActionsQueue()
     _is_rendering: bool = False
 
     # If a thread raises an exception we will update this to raise in the main thread
     _exc_info: Exception | None = None
     _performing_cleanup = False
 
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self._render_done_event = threading.Event()
+        self._server_ready = threading.Event()
+        self._regex_callbacks: list[RegexCallback] | None = None
+
     @property
     def integration_data_interface_version(self) -> SemanticVersion:
         return SemanticVersion(major=0, minor=1)
@@ -126,18 +190,19 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
 
     def _wait_for_socket(self) -> str:
         """
-        Performs a busy wait for the socket path that the adaptor server is running on, then returns it.
+        Waits for the server thread to signal that the adaptor server is running, then returns
+        the socket path it is running on.
 
         :raises: RuntimeError: If the server does not finish initializing
 
         :returns: The socket path the adaptor server is running on.
         :return type: str
         """
-        is_not_timed_out = self._get_timer(self._SERVER_START_TIMEOUT_SECONDS)
-        while (self._server is None or self._server.server_path is None) and is_not_timed_out():
-            time.sleep(0.01)
-
-        if self._server is not None and self._server.server_path is not None:
+        if (
+            self._server_ready.wait(self._SERVER_START_TIMEOUT_SECONDS)
+            and self._server is not None
+            and self._server.server_path is not None
+        ):
             return self._server.server_path
 
         raise RuntimeError(
@@ -150,6 +215,7 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
         blocking call.
         """
         self._server = AdaptorServer(self._action_queue, self)
+        self._server_ready.set()
         _logger.debug("start max server")
         self._server.serve_forever()
 
@@ -169,19 +235,37 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
         """
         Returns a list of RegexCallbacks used by the Max Adaptor
 
+        The list is built once per adaptor and cached; init_data (and with it
+        strict_error_checking) does not change after construction.
+
         :returns: List of Regex Callbacks to add
         :return type: list[RegexCallback]
         """
-        callback_list = []
-        completed_regexes = [re.compile("MaxClient: Finished Rendering Frame [0-9]+")]
-        progress_regexes = [re.compile("\\[PROGRESS\\] ([0-9]+) percent")]
-        error_regexes = [re.compile(".*Exception:.*|.*Error:.*|.*Warning.*")]
-
-        callback_list.append(RegexCallback(completed_regexes, self._handle_complete))
-        callback_list.append(RegexCallback(progress_regexes, self._handle_progress))
+        if self._regex_callbacks is not None:
+            return self._regex_callbacks
+
+        # A line belongs to at most one category, so exit_if_matched stops the handler from
+        # testing the remaining patterns once one has matched.
+        callback_list: list[RegexCallback] = []
+        callback_list.append(
+            _PrefilteredRegexCallback(
+                ("MaxClient: Finished Rendering Frame ",),
+                list(_COMPLETED_RE),
+                self._handle_complete,
+                exit_if_matched=True,
+            )
+        )
+        callback_list.append(
+            RegexCallback(list(_PROGRESS_RE), self._handle_progress, exit_if_matched=True)
+        )
         if self.init_data.get("strict_error_checking", False):
-            callback_list.append(RegexCallback(error_regexes, self._handle_error))
+            callback_list.append(
+                _PrefilteredRegexCallback(
+                    ("Exception", "Error", "Warning"), list(_ERROR_RES), self._handle_error
+                )
+            )
 
+        self._regex_callbacks = callback_list
         return callback_list
 
     @_check_for_exception
@@ -193,6 +277,7 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
         :type match: (re.Match)
         """
         self._max_is_rendering = False
+        self._render_done_event.set()
         self.update_status(progress=100)
 
     @_check_for_exception
@@ -215,20 +300,29 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
 
         :raises: RuntimeError: Always raises a runtime error to halt the adaptor.
         """
-        self._exc_info = RuntimeError(f"Max Encountered an Error: {match.group(0)}")
+        # The error patterns are anchorless fragments; report the whole log line
+        self._exc_info = RuntimeError(f"Max Encountered an Error: {match.string}")
+        self._render_done_event.set()
 
-    @property
+    @functools.cached_property
     def max_client_path(self) -> str:
         """
-        Obtains the max_client.py path by searching directories in sys.path
+        Obtains the max_client.py path by searching directories in sys.path.
+        The search result is cached for the lifetime of the adaptor since it stats every
+        directory on sys.path.
 
         :raises: FileNotFoundError: If the max_client.py file could not be found.
 
         :returns: The path to the max_client.py file.
         :return type: str
         """
+        rel_path = os.path.join("deadline", "max_adaptor", "MaxClient", "max_client.py")
         for dir_ in sys.path:
-            path = os.path.join(dir_, "deadline", "max_adaptor", "MaxClient", "max_client.py")
+            # Most sys.path entries contain no deadline namespace at all, so check the
+            # top-level directory first and skip the deeper stat for those.
+            if not os.path.isdir(os.path.join(dir_, "deadline")):
+                continue
+            path = os.path.join(dir_, rel_path)
             if os.path.isfile(path):
                 return path
         raise FileNotFoundError(
@@ -256,13 +350,10 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
             os.path.dirname(openjd.adaptor_runtime_client.__file__)
         )
         deadline_namespace_dir = os.path.dirname(os.path.dirname(deadline.max_adaptor.__file__))
-        python_path_addition = f"{openjd_namespace_dir}{os.pathsep}{deadline_namespace_dir}"
-        if "PYTHONPATH" in os.environ:
-            os.environ["PYTHONPATH"] = (
-                f"{os.environ['PYTHONPATH']}{os.pathsep}{python_path_addition}"
-            )
-        else:
-            os.environ["PYTHONPATH"] = python_path_addition
+        # Joining only the non-empty parts also avoids a leading separator when
+        # PYTHONPATH is unset or empty.
+        path_parts = [os.environ.get("PYTHONPATH"), openjd_namespace_dir, deadline_namespace_dir]
+        os.environ["PYTHONPATH"] = os.pathsep.join(part for part in path_parts if part)
 
         # PythonHost executes 3ds Max with scripts from cli
         self._max_client = LoggingSubprocess(
@@ -277,17 +368,15 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
         request and perform. The action must be present in the _FIRST_MAX_ACTIONS or _MAX_INIT_KEYS set to be
         added to the action queue.
         """
-        # Set up the renderer, this action decides which handler should be used
-        self._action_queue.enqueue_action(
-            Action("renderer", {"renderer": self.init_data["renderer"]})
+        init_data = self.init_data
+        # Set up the renderer first, this action decides which handler should be used
+        actions = [Action("renderer", {"renderer": init_data["renderer"]})]
+        actions.extend(Action(name, {name: init_data[name]}) for name in _FIRST_MAX_ACTIONS)
+        actions.extend(
+            Action(name, {name: init_data[name]}) for name in _MAX_INIT_KEYS if name in init_data
         )
-
-        for action_name in _FIRST_MAX_ACTIONS:
-            self._action_queue.enqueue_action(self._action_from_action_item(action_name))
-
-        for action_name in _MAX_INIT_KEYS:
-            if action_name in self.init_data:
-                self._action_queue.enqueue_action(self._action_from_action_item(action_name))
+        for action in actions:
+            self._action_queue.enqueue_action(action)
 
     def on_start(self) -> None:
         """
@@ -303,7 +392,7 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
         # Validate init data against schema
         cur_dir = os.path.dirname(__file__)
         schema_dir = os.path.join(cur_dir, "schemas")
-        validators = AdaptorDataValidators.for_adaptor(schema_dir)
+        validators = _data_validators(schema_dir)
         validators.init_data.validate(self.init_data)
 
         self.update_status(progress=0, status_message="Initializing Max")
@@ -319,7 +408,10 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
             and len(self._action_queue) > 0
             and is_not_timed_out()
         ):
-            time.sleep(0.1)  # Busy wait for max to finish initialization
+            # Wakes up as soon as Max drains the initialization actions; the timeout only
+            # bounds how often we re-check the process and exception state, which have no
+            # signal of their own.
+            self._action_queue.empty_event.wait(0.1)
 
         if len(self._action_queue) > 0:
             if is_not_timed_out():
@@ -342,14 +434,17 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
         # Validate run data against schema
         cur_dir = os.path.dirname(__file__)
         schema_dir = os.path.join(cur_dir, "schemas")
-        validators = AdaptorDataValidators.for_adaptor(schema_dir)
+        validators = _data_validators(schema_dir)
         validators.run_data.validate(run_data)
 
         self._max_is_rendering = True
+        self._render_done_event.clear()
         self._action_queue.enqueue_action(Action("start_render", run_data))
 
         while self._max_is_rendering and not self._has_exception:
-            time.sleep(0.1)  # wait for the render to finish
+            # Signaled by _handle_complete and _handle_error; the timeout only bounds how
+            # often we re-check for an early Max exit.
+            self._render_done_event.wait(0.1)
 
         if (
             not self._max_is_running and self._max_client
@@ -404,10 +499,3 @@ class MaxAdaptor(Adaptor[AdaptorConfiguration]):
 
         # Terminate immediately since the Max client does not have a graceful shutdown
         self._max_client.terminate(grace_time_s=0)
-
-    def _action_from_action_item(self, item_name: str) -> Action:
-        _logger.debug(f"____action made for {item_name}_______")
-        return Action(
-            item_name,
-            {item_name: self.init_data[item_name]},
-        )
@@ -31,13 +31,25 @@ except (ImportError, ModuleNotFoundError):
 
 logger = logging.getLogger(__name__)
 
-# Re-assign sys stdout and stderr to print in the console instead of the Max Listener
-sys.stdout = sys.__stdout__
-sys.stderr = sys.__stderr__
+_streams_redirected = False
+
+
+def _redirect_output_streams() -> None:
+    """
+    Re-assigns sys stdout and stderr to print in the console instead of the Max Listener.
+    Only the first call does the reassignment, so modules sharing the process cannot
+    re-trigger it.
+    """
+    global _streams_redirected
+    if not _streams_redirected:
+        sys.stdout = sys.__stdout__
+        sys.stderr = sys.__stderr__
+        _streams_redirected = True
 
 
 class MaxClient(ClientInterface):
     def __init__(self, server_path: str) -> None:
+        _redirect_output_streams()
         super().__init__(server_path=server_path)
         # List of actions that can be performed by the action queue
         self.actions.update(
@@ -3,7 +3,13 @@
 from .default_max_handler import DefaultMaxHandler
 from .art_handler import ArtHandler
 
-__all__ = ["DefaultMaxHandler", "get_render_handler"]
+__all__ = ["ArtHandler", "DefaultMaxHandler", "get_render_handler"]
+
+# Maps renderer names to their handler class; any unlisted renderer falls back to the
+# Default Scanline handler.
+_RENDER_HANDLERS = {
+    "ART_Renderer": ArtHandler,
+}
 
 
 def get_render_handler(renderer: str = "Default_Scanline_Renderer") -> DefaultMaxHandler:
@@ -16,7 +22,4 @@ def get_render_handler(renderer: str = "Default_Scanline_Renderer") -> DefaultMa
 
     :returns: the Render Handler instance for the given renderer.
     """
-    if renderer == "ART_Renderer":
-        return ArtHandler()
-    else:
-        return DefaultMaxHandler()
+    return _RENDER_HANDLERS.get(renderer, DefaultMaxHandler)()
@@ -4,17 +4,11 @@
 Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 """
 
-import sys
-
 import pymxs  # noqa
 from pymxs import runtime as rt
 
 from .default_max_handler import DefaultMaxHandler
 
-# Re-assign sys stdout and stderr to print in the console instead of the Max Listener
-sys.stdout = sys.__stdout__
-sys.stderr = sys.__stderr__
-
 
 class ArtHandler(DefaultMaxHandler):
     """Render Handler for ART"""
@@ -28,7 +22,13 @@ class ArtHandler(DefaultMaxHandler):
     def check_renderer(self) -> None:
         """
         Checks if the active renderer is set to ART Renderer. If it is not, set it to ART Renderer.
+        Only the first call inspects the scene; the handler owns the renderer after that, so
+        repeat calls skip the pymxs round-trip.
         """
-        current_renderer = str(rt.renderers.current).split(":")[0]
-        if current_renderer != "ART_Renderer":
+        if self._renderer_set:
+            return
+        # Compare class identity directly instead of stringifying and splitting the
+        # renderer's display name
+        if rt.classOf(rt.renderers.current) != rt.ART_Renderer:
             rt.renderers.current = rt.ART_Renderer()
+        self._renderer_set = True
@@ -7,7 +7,6 @@ Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
 from __future__ import annotations
 
 import os
-import sys
 import logging
 
 import pymxs  # noqa
@@ -15,10 +14,6 @@ from pymxs import runtime as rt
 
 logger = logging.getLogger(__name__)
 
-# Re-assign sys stdout and stderr to print in the console instead of the Max Listener
-sys.stdout = sys.__stdout__
-sys.stderr = sys.__stderr__
-
 
 class DefaultMaxHandler:
     """Render Handler for Default Scanline Renderer"""
@@ -37,6 +32,14 @@ class DefaultMaxHandler:
         self.output_dir = None
         self.output_name = None
         self.output_format = None
+        self._renderer_set = False
+        # Camera lookups cross the pymxs boundary per node; cache them per scene
+        self._camera_names: set[str] | None = None
+        self._camera_nodes: dict[str, object] = {}
+        # Maps an output name to the (position, width) of its '#' padding run, so the
+        # per-frame path only formats an integer instead of re-scanning the name
+        self._padding_spans: dict[str, tuple[int, int]] = {}
+        self._prepared_output_dir: str | None = None
 
     def start_render(self, data: dict) -> None:
         """
@@ -74,7 +77,7 @@ class DefaultMaxHandler:
         if camera is not None:
             logger.debug("Setting camera with run data")
             camera = self.get_camera_to_render(camera)
-            self.camera_node = rt.getNodeByName(camera)
+            self.camera_node = self._get_camera_node(camera)
             # If camera gets set by run data, add the camera to the output name
             output_name = self.output_name + "_" + camera
 
@@ -91,13 +94,18 @@ class DefaultMaxHandler:
         output_file = output_name + self.output_format
         output_path = os.path.join(self.output_dir, output_file)
 
-        # Create the folder(s) if the directory doesn't exist
-        if not os.path.exists(self.output_dir):
-            os.makedirs(self.output_dir)
+        # Create the folder(s) if the directory doesn't exist; the directory is shared by
+        # every frame of the job, so only the first frame (or a changed directory) pays
+        # the mkdir on the render path
+        if self.output_dir != self._prepared_output_dir:
+            os.makedirs(self.output_dir, exist_ok=True)
+            self._prepared_output_dir = self.output_dir
 
         # Not sure if needed?
-        if os.path.exists(output_path):
+        try:
             os.remove(output_path)
+        except FileNotFoundError:
+            pass
 
         rt.render(camera=self.camera_node, outputFile=output_path)
 
@@ -115,27 +123,38 @@ class DefaultMaxHandler:
         :returns: the updated name
         :return type: str
         """
-        padding_amount = name.count("#")
+        span = self._padding_spans.get(name)
+        if span is None:
+            padding_amount = name.count("#")
+            # The padding is the contiguous run of all hashes; -1 when there is none
+            position = name.find(padding_amount * "#") if padding_amount else -1
+            span = (position, padding_amount)
+            self._padding_spans[name] = span
+        position, padding_amount = span
 
         # If there are no hashes indicating the padding, just add the number
         if not padding_amount:
             return name + str(number)
+        # Scattered hashes have no contiguous run to substitute; leave the name as is
+        if position == -1:
+            return name
 
-        numbers_amount = len(str(number))
-        # Calculate how many zeroes need to be added.
         # If the frame number is longer than the padding, no zeroes get added
-        zeroes_to_add = padding_amount - numbers_amount
-        padded_number = zeroes_to_add * "0" + str(number)
-        name = name.replace(padding_amount * "#", padded_number)
-        return name
+        return f"{name[:position]}{number:0{padding_amount}d}{name[position + padding_amount:]}"
 
     def check_renderer(self) -> None:
         """
         Checks if the active renderer is set to Default Scanline Renderer. If it is not, set it to Default Scanline.
+        Only the first call inspects the scene; the handler owns the renderer after that, so
+        repeat calls skip the pymxs round-trip.
         """
-        current_renderer = str(rt.renderers.current).split(":")[0]
-        if current_renderer != "Default_Scanline_Renderer":
+        if self._renderer_set:
+            return
+        # Compare class identity directly instead of stringifying and splitting the
+        # renderer's display name
+        if rt.classOf(rt.renderers.current) != rt.Default_Scanline_Renderer:
             rt.renderers.current = rt.Default_Scanline_Renderer()
+        self._renderer_set = True
 
     def set_camera(self, data: dict) -> None:
         """
@@ -150,7 +169,7 @@ class DefaultMaxHandler:
             print("No camera specified in init data")
             return
         camera = self.get_camera_to_render(camera_name)
-        self.camera_node = rt.getNodeByName(camera)
+        self.camera_node = self._get_camera_node(camera)
 
     def get_camera_to_render(self, camera_name: str) -> str:
         """
@@ -161,16 +180,30 @@ class DefaultMaxHandler:
 
         :raises: RuntimeError: If the camera does not exist
         """
-        # rt.cameras gives a max collection of cameras
-        # Conversion to python list needed
-        cameras = rt.cameras
-        camera_names = [camera.name for camera in cameras]
+        # rt.cameras gives a max collection of cameras; iterating it marshals every node
+        # name across pymxs, so build the name set once per scene
+        if self._camera_names is None:
+            self._camera_names = {camera.name for camera in rt.cameras}
 
-        if camera_name not in camera_names:
+        if camera_name not in self._camera_names:
             print(f"Error: The specified camera, {camera_name}, does not exist.")
             raise RuntimeError(f"The specified camera, {camera_name}, does not exist.")
         return camera_name
 
+    def _get_camera_node(self, camera_name: str):
+        """
+        Returns the scene node for the given camera name, reusing a handle resolved earlier
+        in the same scene when possible.
+
+        :param camera_name: the name of the camera to look up
+        :type camera_name: str
+        """
+        node = self._camera_nodes.get(camera_name)
+        if node is None:
+            node = rt.getNodeByName(camera_name)
+            self._camera_nodes[camera_name] = node
+        return node
+
     def set_output_file_path(self, data: dict) -> None:
         """
         Sets the output file path.
@@ -217,36 +250,33 @@ class DefaultMaxHandler:
         :raises: RuntimeError: if state set doesn't exist
         """
         state_set_name = data.get("state_set")
+        if not state_set_name:
+            print(f"Error: The specified state set, '{state_set_name}', does not exist.")
+            raise RuntimeError(f"The specified state set, '{state_set_name}', does not exist.")
 
-        # Create necessary items to interact with state sets
-        state_sets_dot_net_object = rt.dotNetObject("Autodesk.Max.StateSets.Plugin")
-        state_sets_instance = state_sets_dot_net_object.Instance
-        master_state = state_sets_instance.EntityManager.RootEntity.MasterStateSet
+        # The name is spliced into a MaxScript string literal; escape accordingly
+        escaped_name = state_set_name.replace("\\", "\\\\").replace('"', '\\"')
 
-        state_sets = []
-        need_state: int
-        # Loop over all state sets in the scene to get the correct index
-        # Note: 3dsMax has a weird indexing system, so we start at -1.
+        # Setting the state set only works in MaxScript. Resolving the name there as well
+        # keeps the iteration over Children inside Max instead of marshaling every item
+        # name across pymxs.
         # Note: The last item in the list is a default 'Objects' state, where (unless manually changed) all objects are
         #  set to hidden. We don't want to include this state set in our iteration
-        for i in range(-1, master_state.Children.count - 2):
-            state_sets.append([master_state.Children.Item[i].Name, i + 1])
-            if master_state.Children.Item[i].Name == state_set_name:
-                need_state = i + 1
-
-        # Set the current state set
-        try:
-            # Setting the state set only works in MaxScript
-            rt.execute(
-                f"stateSetsDotNetObject = dotNetObject "
-                f'"Autodesk.Max.StateSets.Plugin" \n'
-                f"stateSets = stateSetsDotNetObject.Instance \n"
-                f"masterState = stateSets.EntityManager.RootEntity."
-                f"MasterStateSet \n"
-                f"needState = masterState.Children.Item[{need_state}]\n"
-                f"masterState.CurrentState = #(needState)"
-            )
-        except NameError:
+        found = rt.execute(
+            'stateSetsDotNetObject = dotNetObject "Autodesk.Max.StateSets.Plugin"\n'
+            "stateSets = stateSetsDotNetObject.Instance\n"
+            "masterState = stateSets.EntityManager.RootEntity.MasterStateSet\n"
+            "foundState = undefined\n"
+            "for i = 0 to masterState.Children.count - 2 do (\n"
+            f'    if masterState.Children.Item[i].Name == "{escaped_name}" then\n'
+            "        foundState = masterState.Children.Item[i]\n"
+            ")\n"
+            "if foundState != undefined then (\n"
+            "    masterState.CurrentState = #(foundState)\n"
+            "    true\n"
+            ") else false"
+        )
+        if not found:
             print(f"Error: The specified state set, '{state_set_name}', does not exist.")
             raise RuntimeError(f"The specified state set, '{state_set_name}', does not exist.")
 
@@ -272,3 +302,6 @@ class DefaultMaxHandler:
         except Exception:
             print(f"Error: while opening '{file_path}'")
             raise RuntimeError(f"Error: while opening '{file_path}'")
+        # The camera caches describe the previous scene
+        self._camera_names = None
+        self._camera_nodes.clear()
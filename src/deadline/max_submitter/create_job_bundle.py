@@ -4,12 +4,20 @@
 3ds Max Deadline Cloud Submitter - Functions for generating the job template and parameter values files
 """
 
-from copy import deepcopy
+from __future__ import annotations
+
 from typing import Any
+import json
 import os
 from pathlib import Path
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader  # type: ignore[attr-defined]
+except ImportError:
+    # libyaml is not available in every 3ds Max python environment
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
 from deadline.client.exceptions import DeadlineOperationError
 
 from utilities import max_utils
@@ -17,6 +25,34 @@ from data_classes import RenderSubmitterUISettings, StateSetData
 from data_const import ALL_CAMERAS_STR, ALL_STEREO_CAMERAS_STR, ALL_STATE_SETS_STR
 
 
+_OVERRIDE_ENVIRONMENT_PATH = Path(__file__).parent / "adaptor_override_environment.yaml"
+# (mtime, parsed template) of the last adaptor_override_environment.yaml parse
+_override_environment_cache: tuple[float, dict[str, Any]] | None = None
+
+
+def _load_override_environment() -> dict[str, Any]:
+    """
+    Parses adaptor_override_environment.yaml, reusing the previous parse for as long as the
+    file's mtime is unchanged. Returns a fresh copy that the caller may mutate.
+    """
+    global _override_environment_cache
+    mtime = os.path.getmtime(_OVERRIDE_ENVIRONMENT_PATH)
+    if _override_environment_cache is None or _override_environment_cache[0] != mtime:
+        with open(_OVERRIDE_ENVIRONMENT_PATH) as f:
+            _override_environment_cache = (mtime, yaml.load(f, Loader=_YamlLoader))
+    return _clone_template(_override_environment_cache[1])
+
+
+def _clone_template(template: dict[str, Any]) -> dict[str, Any]:
+    """
+    Returns a deep copy of a YAML-loaded template. The templates are plain dict/list/str
+    trees, so a JSON round-trip is much faster than copy.deepcopy's generic dispatch.
+
+    :param template: the template to copy
+    """
+    return json.loads(json.dumps(template))
+
+
 def get_job_template(
     default_job_template: dict[str, Any],
     settings: RenderSubmitterUISettings,
@@ -65,7 +101,7 @@ def _create_param_definitions(
     :param state_sets: a list of StateSetData for the submitted state sets
     :param cameras_in_scene: all cameras based on the UI selection
     """
-    job_template = deepcopy(default_job_template)
+    job_template = _clone_template(default_job_template)
     # Set the job's name
     job_template["name"] = settings.name
     if settings.description:
@@ -121,14 +157,19 @@ def _create_state_set_param_definitions(
     :param type_: the type of the parameter e.g. Frames, ImageWidth, ...
     :param state_sets: list of StateSetData all submitted state sets
     """
-    single_param = [
-        param for param in job_template["parameterDefinitions"] if param["name"] == type_
-    ][0]
-    job_template["parameterDefinitions"] = [
-        param for param in job_template["parameterDefinitions"] if param["name"] != type_
-    ]
+    # Split out the matching param and the remaining ones in one pass
+    single_param = None
+    remaining_params = []
+    for param in job_template["parameterDefinitions"]:
+        if param["name"] == type_:
+            single_param = param
+        else:
+            remaining_params.append(param)
+    job_template["parameterDefinitions"] = remaining_params
+    # Serialize once; each state set clones from the JSON string
+    single_param_json = json.dumps(single_param)
     for state_set in state_sets:
-        state_set_param = deepcopy(single_param)
+        state_set_param = json.loads(single_param_json)
         state_set_param["name"] = state_set.state_set + type_
         state_set_param["userInterface"]["groupLabel"] = state_set.ui_group_label
         job_template["parameterDefinitions"].append(state_set_param)
@@ -163,15 +204,26 @@ def _create_step_definitions(
         ["image_resolution", "ImageHeight", "image_height"],
     ]
 
+    # _check_multiples scans every state set, so resolve each flag once up front instead
+    # of per state set
+    multi_flags = {
+        possible_multiple[0]: _check_multiples(state_sets, possible_multiple[0])
+        for possible_multiple in possible_multiples
+    }
+    multi_frame_range = _check_multiples(state_sets, "frame_range")
+
+    # Serialize once; each state set clones from the JSON string
+    default_step_json = json.dumps(default_step)
+
     for state_set in state_sets:
-        step = deepcopy(default_step)
+        step = json.loads(default_step_json)
         job_template["steps"].append(step)
 
         step["name"] = state_set.state_set
         parameters_space = step["parameterSpace"]
 
         # Update the 'Param.Frames' reference in the Frame task parameter if there are multiple ranges
-        if _check_multiples(state_sets, "frame_range"):
+        if multi_frame_range:
             parameters_space["taskParameterDefinitions"][0]["range"] = (
                 "{{Param." + state_set.state_set + "Frames}}"
             )
@@ -187,18 +239,19 @@ def _create_step_definitions(
             run_data = step["script"]["embeddedFiles"][0]
             run_data["data"] += "camera: '{{Task.Param.Camera}}'"
 
-        # init data of the step
+        # init data of the step; accumulate the fragments and join once instead of
+        # rebuilding the string on every concatenation
         init_data = step["stepEnvironments"][0]["script"]["embeddedFiles"][0]
-        init_data["data"] = (
-            init_data["data"]
-            + f"renderer: {state_set.renderer}\n"
-            + f"state_set: {state_set.state_set}\n"
-            + f"output_file_name: {state_set.output_file_name}\n"
-        )
+        data_parts = [
+            init_data["data"],
+            f"renderer: {state_set.renderer}\n",
+            f"state_set: {state_set.state_set}\n",
+            f"output_file_name: {state_set.output_file_name}\n",
+        ]
 
         for possible_multiple in possible_multiples:
-            if _check_multiples(state_sets, possible_multiple[0]):
-                init_data["data"] += (
+            if multi_flags[possible_multiple[0]]:
+                data_parts.append(
                     possible_multiple[2]
                     + ": '{{Param."
                     + state_set.state_set
@@ -206,7 +259,7 @@ def _create_step_definitions(
                     + "}}'\n"
                 )
             else:
-                init_data["data"] += (
+                data_parts.append(
                     possible_multiple[2] + ": '{{Param." + possible_multiple[1] + "}}'\n"
                 )
 
@@ -215,7 +268,9 @@ def _create_step_definitions(
             settings.camera_selection != ALL_CAMERAS_STR
             and settings.camera_selection != ALL_STEREO_CAMERAS_STR
         ):
-            init_data["data"] += "camera: '{{Param.Camera}}'\n"
+            data_parts.append("camera: '{{Param.Camera}}'\n")
+
+        init_data["data"] = "".join(data_parts)
 
     return job_template
 
@@ -225,19 +280,19 @@ def _merge_adaptor_override_environment():
     Create template for the adaptor override environment
     """
     # TODO see if changes to adaptor_override_environment.yaml need to be made to work on windows worker
-    with open(Path(__file__).parent / "adaptor_override_environment.yaml") as f:
-        override_environment = yaml.safe_load(f)
+    override_environment = _load_override_environment()
 
     # Read DEVELOPMENT.md for instructions to create the wheels directory.
     wheels_path = Path(__file__).parent.parent.parent.parent / "wheels"
-    if not wheels_path.exists() and wheels_path.is_dir():
+    if not (wheels_path.exists() and wheels_path.is_dir()):
         raise RuntimeError(
             "The Developer Option 'Include Adaptor Wheels' is enabled, "
             "but the wheels directory does not exist:\n" + str(wheels_path)
         )
-    wheels_path_package_names = {
-        path.split("-", 1)[0] for path in os.listdir(wheels_path) if path.endswith(".whl")
-    }
+    with os.scandir(wheels_path) as entries:
+        wheels_path_package_names = {
+            entry.name.split("-", 1)[0] for entry in entries if entry.name.endswith(".whl")
+        }
     if wheels_path_package_names != {
         "openjd_adaptor_runtime",
         "deadline",
@@ -250,18 +305,14 @@ def _merge_adaptor_override_environment():
             + f"Actual: {wheels_path_package_names}"
         )
 
-    override_adaptor_wheels_param = [
-        param
-        for param in override_environment["parameterDefinitions"]
-        if param["name"] == "OverrideAdaptorWheels"
-    ][0]
-    override_adaptor_wheels_param["default"] = str(wheels_path)
-    override_adaptor_name_param = [
-        param
-        for param in override_environment["parameterDefinitions"]
-        if param["name"] == "OverrideAdaptorName"
-    ][0]
-    override_adaptor_name_param["default"] = "3dsmax-openjd"
+    # Set both defaults in a single scan of the parameter definitions
+    for param in override_environment["parameterDefinitions"]:
+        if param["name"] == "OverrideAdaptorWheels":
+            param["default"] = str(wheels_path)
+        elif param["name"] == "OverrideAdaptorName":
+            param["default"] = "3dsmax-openjd"
+
+    return override_environment
 
 
 def get_parameters_values(
@@ -297,59 +348,45 @@ def _get_job_parameters(
     :param settings: a RenderSubmitterUISettings object containing the latest UI settings
     :param state_sets: a list of StateSetData for the submitted state sets
     """
-    parameter_values: list[dict[str, Any]] = []
-
-    parameter_values.append({"name": "MaxSceneFile", "value": max_utils.get_scene_path()})
+    parameter_values: list[dict[str, Any]] = [
+        {"name": "MaxSceneFile", "value": max_utils.get_scene_path()}
+    ]
 
     possible_multiples = [
-        ["frame_range", "Frames"],
-        ["output_file_dir", "OutputFilePath"],
-        ["output_file_format", "OutputFileFormat"],
+        ("frame_range", "Frames"),
+        ("output_file_dir", "OutputFilePath"),
+        ("output_file_format", "OutputFileFormat"),
     ]
-    for possible_multiple in possible_multiples:
-        if _check_multiples(state_sets, possible_multiple[0]):
-            for state_set in state_sets:
-                parameter_values.append(
-                    {
-                        "name": state_set.state_set + possible_multiple[1],
-                        "value": getattr(state_set, possible_multiple[0]),
-                    }
-                )
-        else:
-            parameter_values.append(
-                {
-                    "name": possible_multiple[1],
-                    "value": getattr(state_sets[0], possible_multiple[0]),
-                }
+    for field, param_name in possible_multiples:
+        if _check_multiples(state_sets, field):
+            parameter_values.extend(
+                {"name": state_set.state_set + param_name, "value": getattr(state_set, field)}
+                for state_set in state_sets
             )
+        else:
+            parameter_values.append({"name": param_name, "value": getattr(state_sets[0], field)})
 
     # Check if there are multiple output resolution
     if _check_multiples(state_sets, "image_resolution"):
         for state_set in state_sets:
-            parameter_values.append(
-                {
-                    "name": state_set.state_set + "ImageWidth",
-                    "value": state_set.image_resolution[0],
-                }
-            )
-            parameter_values.append(
-                {
-                    "name": state_set.state_set + "ImageHeight",
-                    "value": state_set.image_resolution[1],
-                }
+            parameter_values.extend(
+                (
+                    {
+                        "name": state_set.state_set + "ImageWidth",
+                        "value": state_set.image_resolution[0],
+                    },
+                    {
+                        "name": state_set.state_set + "ImageHeight",
+                        "value": state_set.image_resolution[1],
+                    },
+                )
             )
     else:
-        parameter_values.append(
-            {
-                "name": "ImageWidth",
-                "value": state_sets[0].image_resolution[0],
-            }
-        )
-        parameter_values.append(
-            {
-                "name": "ImageHeight",
-                "value": state_sets[0].image_resolution[1],
-            }
+        parameter_values.extend(
+            (
+                {"name": "ImageWidth", "value": state_sets[0].image_resolution[0]},
+                {"name": "ImageHeight", "value": state_sets[0].image_resolution[1]},
+            )
         )
 
     # Only add camera parameter when a specific camera is selected
@@ -421,9 +458,5 @@ def _check_multiples(state_sets: list[StateSetData], type_: str) -> bool:
     """
     if not hasattr(state_sets[0], type_):
         return False
-    previous = getattr(state_sets[0], type_)
-    for state_set in state_sets:
-        if getattr(state_set, type_) != previous:
-            return True
-        previous = getattr(state_set, type_)
-    return False
+    first = getattr(state_sets[0], type_)
+    return any(getattr(state_set, type_) != first for state_set in state_sets[1:])
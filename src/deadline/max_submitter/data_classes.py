@@ -8,6 +8,8 @@ import dataclasses
 from dataclasses import dataclass, field
 from pathlib import Path
 import json
+import sys
+import traceback
 from typing import Optional
 
 import pymxs  # noqa
@@ -15,6 +17,60 @@ from pymxs import runtime as rt
 
 from data_const import ALL_CAMERAS_STR, RENDER_SUBMITTER_SETTINGS_FILE_EXT
 
+# orjson parses and serializes considerably faster than the stdlib json module; fall back
+# to the stdlib when it isn't available in the Max python environment
+try:
+    import orjson  # type: ignore[import]
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj: dict) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: dict) -> bytes:
+        return json.dumps(obj, indent=1).encode("utf8")
+
+
+# Cached sticky settings path for the current scene. Reading rt.maxFilePath and
+# rt.maxFileName crosses the pymxs boundary, so the resolved path is kept until Max
+# reports a scene change through the callbacks registered below.
+_scene_settings_path: Optional[Path] = None
+_scene_callbacks_registered = False
+
+_SCENE_CHANGE_CALLBACK_ID = "DeadlineCloudStickySettings"
+_SCENE_CHANGE_EVENTS = ("filePostOpen", "filePostSave", "systemPostNew", "systemPostReset")
+
+
+def _invalidate_scene_settings_path() -> None:
+    """
+    Drops the cached sticky settings path; triggered by Max when the scene changes
+    """
+    global _scene_settings_path
+    _scene_settings_path = None
+
+
+def _current_scene_settings_path() -> Path:
+    """
+    Returns the path of the sticky settings file saved alongside the current max scene
+    """
+    global _scene_settings_path, _scene_callbacks_registered
+    if not _scene_callbacks_registered:
+        for event in _SCENE_CHANGE_EVENTS:
+            rt.callbacks.addScript(
+                rt.Name(event),
+                'python.execute "import data_classes; data_classes._invalidate_scene_settings_path()"',
+                id=rt.Name(_SCENE_CHANGE_CALLBACK_ID),
+            )
+        _scene_callbacks_registered = True
+    if _scene_settings_path is None:
+        _scene_settings_path = Path(rt.maxFilePath, rt.maxFileName).with_suffix(
+            RENDER_SUBMITTER_SETTINGS_FILE_EXT
+        )
+    return _scene_settings_path
+
 
 @dataclass
 class StateSetData:
@@ -86,45 +142,54 @@ class RenderSubmitterUISettings:
         """
         Reads sticky settings from the sticky settings json file saved alongside the max scene
         """
-        scene = rt.maxFilePath + rt.maxFileName
-        sticky_settings_filename = Path(scene).with_suffix(RENDER_SUBMITTER_SETTINGS_FILE_EXT)
-        if sticky_settings_filename.exists() and sticky_settings_filename.is_file():
-            try:
-                with open(sticky_settings_filename, encoding="utf8") as fh:
-                    sticky_settings = json.load(fh)
-
-                if isinstance(sticky_settings, dict):
-                    sticky_fields = {
-                        field.name: field
-                        for field in dataclasses.fields(self)
-                        if field.metadata.get("sticky")
-                    }
-                    for name, value in sticky_settings.items():
-                        # Only set fields that are defined in the dataclass
-                        if name in sticky_fields:
-                            setattr(self, name, value)
-            except (OSError, json.JSONDecodeError):
-                # If something bad happened to the sticky settings file, just use the defaults instead of
-                # producing an error.
-                import traceback
-
-                traceback.print_exc()
-                print(
-                    f"WARNING: Failed to load sticky settings file {sticky_settings_filename}, reverting to the "
-                    "default settings."
-                )
-                pass
+        sticky_settings_filename = _current_scene_settings_path()
+        try:
+            # Open directly instead of stat-ing first; a missing file is the common,
+            # expected case and costs a single syscall this way
+            # Binary mode skips the text-mode decoder; both parsers take bytes
+            with open(sticky_settings_filename, "rb") as fh:
+                sticky_settings = _json_loads(fh.read())
+
+            if isinstance(sticky_settings, dict):
+                # Iterate the known sticky fields and probe the loaded dict, rather
+                # than scanning the field names for every key the file happens to hold;
+                # unknown keys are skipped without any membership test
+                for name in _STICKY_FIELDS:
+                    value = sticky_settings.get(name, _MISSING)
+                    if value is not _MISSING:
+                        setattr(self, name, value)
+        except (FileNotFoundError, IsADirectoryError):
+            # No sticky settings were saved alongside this scene; keep the defaults
+            pass
+        except (OSError, ValueError):
+            # If something bad happened to the sticky settings file, just use the defaults instead of
+            # producing an error.
+            traceback.print_exc()
+            print(
+                f"WARNING: Failed to load sticky settings file {sticky_settings_filename}, reverting to the "
+                "default settings."
+            )
+            pass
 
     def save_sticky_settings(self):
         """
         Writes sticky settings to json file at same directory as max scene
         """
-        scene = rt.maxFilePath + rt.maxFileName
-        sticky_settings_filename = Path(scene).with_suffix(RENDER_SUBMITTER_SETTINGS_FILE_EXT)
-        with open(sticky_settings_filename, "w", encoding="utf8") as fh:
-            obj = {
-                field.name: getattr(self, field.name)
-                for field in dataclasses.fields(self)
-                if field.metadata.get("sticky")
-            }
-            json.dump(obj, fh, indent=1)
+        sticky_settings_filename = _current_scene_settings_path()
+        obj = {name: getattr(self, name) for name in _STICKY_FIELDS}
+        # Serialize fully in memory and issue a single write instead of streaming many
+        # small chunks through a file object
+        sticky_settings_filename.write_bytes(_json_dumps(obj))
+
+
+# Sentinel distinguishing "key absent" from legitimately falsy sticky values
+_MISSING = object()
+
+# The sticky fields never change after class creation, so resolve them once instead of
+# walking dataclasses.fields() and its metadata mappings on every load/save. Interned
+# names let the setattr/getattr dict probes short-circuit on pointer identity.
+_STICKY_FIELDS = tuple(
+    sys.intern(field.name)
+    for field in dataclasses.fields(RenderSubmitterUISettings)
+    if field.metadata.get("sticky")
+)
@@ -18,40 +18,68 @@ RENDER_SUBMITTER_SETTINGS_FILE_EXT = ".deadline_render_settings.json"
 # Filename for backup created at submission
 TEMP_BACKUP_FILENAME = "max_backup_file.mx"
 
-# Renderers currently supported by Deadline Cloud
-ALLOWED_RENDERERS = ["Default_Scanline_Renderer", "ART_Renderer"]
-
-# Possible output extensions
-ALLOWED_EXTENSIONS = [
-    ["AVI File (*.avi)", ".avi"],
-    ["BMP Image File (*.bmp)", ".bmp"],
-    ["Kodak Cineon (*.cin)", ".cin"],
-    ["Encapsulated PostScript File (*.eps)", ".eps"],
-    ["OpenEXR Image File (*.exr)", ".exr"],
-    ["Radiance Image File (HDRI) (*.hdr)", ".hdr"],
-    ["JPEG File (*.jpg)", ".jpg"],
-    ["PNG Image File (*.png)", ".png"],
-    ["RLA Image File (*.rla)", ".rla"],
-    ["RPF Image File (*.rpf)", ".rpf"],
-    ["Targa Image File (*.tga)", ".tga"],
-    ["TIF Image File (*.tif)", ".tif"],
-    ["DDS Image File (*.dds)", ".dds"],
-]
-
-# Materials allowed for custom override on submit
-SCENE_TWEAKS_MATS = [
+# Renderers currently supported by Deadline Cloud; a frozenset since it is only used
+# for membership checks
+ALLOWED_RENDERERS = frozenset({"Default_Scanline_Renderer", "ART_Renderer"})
+
+# Possible output extensions, stored as parallel tuples with a precomputed lookup dict
+# so consumers can iterate either side or map a suffix to its label in O(1)
+ALLOWED_EXTENSION_LABELS = (
+    "AVI File (*.avi)",
+    "BMP Image File (*.bmp)",
+    "Kodak Cineon (*.cin)",
+    "Encapsulated PostScript File (*.eps)",
+    "OpenEXR Image File (*.exr)",
+    "Radiance Image File (HDRI) (*.hdr)",
+    "JPEG File (*.jpg)",
+    "PNG Image File (*.png)",
+    "RLA Image File (*.rla)",
+    "RPF Image File (*.rpf)",
+    "Targa Image File (*.tga)",
+    "TIF Image File (*.tif)",
+    "DDS Image File (*.dds)",
+)
+ALLOWED_EXTENSION_SUFFIXES = (
+    ".avi",
+    ".bmp",
+    ".cin",
+    ".eps",
+    ".exr",
+    ".hdr",
+    ".jpg",
+    ".png",
+    ".rla",
+    ".rpf",
+    ".tga",
+    ".tif",
+    ".dds",
+)
+EXT_TO_LABEL = dict(zip(ALLOWED_EXTENSION_SUFFIXES, ALLOWED_EXTENSION_LABELS))
+
+# Materials allowed for custom override on submit; ordered and indexed by consumers,
+# and never mutated, so a tuple
+SCENE_TWEAKS_MATS = (
     "Standard Grayscale Material",
     "Object Wireframe Color",
     "Layer Color",
     "Material Editor Slot 1",
-]
-
-# All options for stereo camera submissions
-STEREO_CAMERA_OPTIONS = [
-    ["Left Eye Only", "Left"],
-    ["Right Eye Only", "Right"],
-    ["Center Only", "Center"],
-    ["Left and Right Eye", "Left_Right"],
-    ["Left, Right and Center", "All"],
-    ["Disable Stereo Camera Submission", "None"],
-]
+)
+
+# All options for stereo camera submissions, stored as parallel tuples like the
+# extension tables above
+STEREO_CAMERA_OPTION_LABELS = (
+    "Left Eye Only",
+    "Right Eye Only",
+    "Center Only",
+    "Left and Right Eye",
+    "Left, Right and Center",
+    "Disable Stereo Camera Submission",
+)
+STEREO_CAMERA_OPTION_VALUES = (
+    "Left",
+    "Right",
+    "Center",
+    "Left_Right",
+    "All",
+    "None",
+)
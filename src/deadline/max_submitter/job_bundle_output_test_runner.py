@@ -3,8 +3,14 @@
 """
 Defines the Render submitter command which is registered in 3ds Max.
 """
+import hashlib
+import io
+import itertools
 import os
+import re
+import subprocess
 import tempfile
+from concurrent.futures import Future, ThreadPoolExecutor
 from unittest import mock
 import shutil
 import filecmp
@@ -60,8 +66,72 @@ def _show_deadline_cloud_submitter():
 # The following functions implement the test logic.
 
 
+# Files larger than this get a truncated diff in the report
+_DIFF_TRUNCATE_SIZE = 1024 * 1024
+_DIFF_TRUNCATE_LINES = 200
+
+
+def _file_sha256(path: str) -> bytes:
+    """Returns the sha256 digest of the file at the given path."""
+    with open(path, "rb") as fh:
+        if hasattr(hashlib, "file_digest"):
+            # Python 3.11+; reads with a reused buffer at the C level
+            return hashlib.file_digest(fh, "sha256").digest()
+        digest = hashlib.sha256()
+        while chunk := fh.read(1024 * 1024):
+            digest.update(chunk)
+        return digest.digest()
+
+
+# Resolving the local timezone reads system tz data; do it once at import
+_LOCAL_TZ = datetime.now(timezone.utc).astimezone().tzinfo
+
+
+def _unified_diff(expected_file: str, test_file: str, label: str) -> str:
+    """
+    Returns a unified diff of the two files, preferring the system diff tool (Myers'
+    algorithm in C) and falling back to difflib's pure-Python SequenceMatcher when no
+    diff executable is available.
+    """
+    try:
+        result = subprocess.run(
+            [
+                "diff",
+                "-u",
+                "--label",
+                "expected/" + label,
+                "--label",
+                "test/" + label,
+                expected_file,
+                test_file,
+            ],
+            capture_output=True,
+            text=True,
+        )
+        # 0 means identical, 1 means differences found; anything else is a diff error
+        if result.returncode in (0, 1):
+            return result.stdout
+    except OSError:
+        pass
+
+    with (
+        open(expected_file, encoding="utf8") as fleft,
+        open(test_file, encoding="utf8") as fright,
+    ):
+        # readlines() splits the buffer in C; list(fileobj) iterates
+        # line-by-line through the Python iterator protocol
+        return "".join(
+            difflib.unified_diff(
+                fleft.readlines(),
+                fright.readlines(),
+                "expected/" + label,
+                "test/" + label,
+            )
+        )
+
+
 def _timestamp_string() -> str:
-    return datetime.now(timezone.utc).astimezone().isoformat()
+    return datetime.now(_LOCAL_TZ).isoformat()
 
 
 def run_max_render_submitter_job_bundle_output_test():
@@ -73,7 +143,7 @@ def run_max_render_submitter_job_bundle_output_test():
     count_succeeded = 0
     count_failed = 0
     with gui_error_handler("Error running job bundle output test", mainwin):
-        default_tests_dir = Path(__file__).parent.parent.parent.parent / "job_bundle_output_tests"
+        default_tests_dir = Path(__file__).parents[3] / "job_bundle_output_tests"
 
         tests_dir = QFileDialog.getExistingDirectory(
             mainwin, "Select a Directory Containing Max Job Bundle Tests", str(default_tests_dir)
@@ -85,28 +155,45 @@ def run_max_render_submitter_job_bundle_output_test():
         tests_dir = os.path.normpath(tests_dir)
 
         test_job_bundle_results_file = os.path.join(tests_dir, "test-job-bundle-results.txt")
-        with open(test_job_bundle_results_file, "w", encoding="utf8") as report_fh:
-            for test_name in os.listdir(tests_dir):
-                job_bundle_test = os.path.join(tests_dir, test_name)
-                if not os.path.isdir(job_bundle_test):
-                    continue
-                report_fh.write(f"\nTimestamp: {_timestamp_string()}\n")
-                report_fh.write(f"Running job bundle output test: {job_bundle_test}\n")
-
-                dcc_scene_file = os.path.join(job_bundle_test, "scene", f"{test_name}.max")
+        # Accumulate the report in memory and write the file once at the end; the
+        # finally still persists a partial report if a test blows up mid-run
+        report_fh = io.StringIO()
+        try:
+            # scandir serves is_dir() from the directory read itself, so the loop skips
+            # the extra stat call per entry that listdir + isdir would make
+            with os.scandir(tests_dir) as dir_entries:
+                test_dirs = [
+                    (entry.name, entry.path)
+                    for entry in dir_entries
+                    if entry.is_dir(follow_symlinks=False)
+                ]
+            # Each test has to open its scene in the single 3ds Max instance, but the
+            # post-export work (path normalization, dircmp, diffs) only touches files.
+            # Hand that part to a small thread pool so it overlaps with the next test's
+            # scene load, and collect the per-test reports in submission order.
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                pending: list[Future] = []
+                for test_name, job_bundle_test in test_dirs:
+                    dcc_scene_file = os.path.join(job_bundle_test, "scene", f"{test_name}.max")
+
+                    if not (os.path.exists(dcc_scene_file) and os.path.isfile(dcc_scene_file)):
+                        raise DeadlineOperationError(
+                            f"Directory {job_bundle_test} does not contain the expected .max scene: {dcc_scene_file}."
+                        )
 
-                if not (os.path.exists(dcc_scene_file) and os.path.isfile(dcc_scene_file)):
-                    raise DeadlineOperationError(
-                        f"Directory {job_bundle_test} does not contain the expected .max scene: {dcc_scene_file}."
+                    pending.append(
+                        _run_job_bundle_output_test(
+                            job_bundle_test, dcc_scene_file, mainwin, executor
+                        )
                     )
 
-                succeeded = _run_job_bundle_output_test(
-                    job_bundle_test, dcc_scene_file, report_fh, mainwin
-                )
-                if succeeded:
-                    count_succeeded += 1
-                else:
-                    count_failed += 1
+                for future in pending:
+                    succeeded, report = future.result()
+                    report_fh.write(report)
+                    if succeeded:
+                        count_succeeded += 1
+                    else:
+                        count_failed += 1
 
             report_fh.write("\n")
             if count_failed:
@@ -124,10 +211,22 @@ def run_max_render_submitter_job_bundle_output_test():
                     f"Ran {count_succeeded} tests in total.",
                 )
             report_fh.write(f"Timestamp: {_timestamp_string()}\n")
+        finally:
+            with open(test_job_bundle_results_file, "w", encoding="utf8") as fh:
+                fh.write(report_fh.getvalue())
 
 
-def _run_job_bundle_output_test(test_dir: str, dcc_scene_file: str, report_fh, mainwin: Any):
-    with tempfile.TemporaryDirectory(prefix="job_bundle_output_test") as tempdir:
+def _run_job_bundle_output_test(
+    test_dir: str, dcc_scene_file: str, mainwin: Any, executor: ThreadPoolExecutor
+) -> Future:
+    """
+    Exports the job bundle for one test in the DCC, then schedules the pure-file
+    comparison on the executor. Returns a future resolving to a (succeeded, report)
+    tuple; the worker owns the temp directory and removes it when done.
+    """
+    timestamp = _timestamp_string()
+    tempdir = tempfile.mkdtemp(prefix="job_bundle_output_test")
+    try:
         temp_job_bundle_dir = os.path.join(tempdir, "job_bundle")
         os.makedirs(temp_job_bundle_dir, exist_ok=True)
 
@@ -166,63 +265,119 @@ def _run_job_bundle_output_test(test_dir: str, dcc_scene_file: str, report_fh, m
         # Close the DCC scene file
         _close_dcc_scene_file()
         submitter.close()
+    except BaseException:
+        shutil.rmtree(tempdir, ignore_errors=True)
+        raise
 
-        # Process every file in the job bundle to replace the temp dir with a standardized path
-        for filename in os.listdir(temp_job_bundle_dir):
-            full_filename = os.path.join(temp_job_bundle_dir, filename)
-            with open(full_filename, encoding="utf8") as f:
-                contents = f.read()
-            contents = contents.replace(tempdir + "\\", "/normalized/job/bundle/dir/")
-            contents = contents.replace(
-                tempdir.replace("\\", "/") + "/", "/normalized/job/bundle/dir/"
-            )
-            contents = contents.replace(tempdir, "/normalized/job/bundle/dir")
-            contents = contents.replace(tempdir.replace("\\", "/"), "/normalized/job/bundle/dir")
-            with open(full_filename, "w", encoding="utf8") as f:
-                f.write(contents)
-
-        # If there's an expected job bundle to compare with, do the comparison,
-        # otherwise copy the one we created to be that expected job bundle.
-        expected_job_bundle_dir = os.path.join(test_dir, "expected_job_bundle")
-        if os.path.exists(expected_job_bundle_dir):
-            test_job_bundle_dir = os.path.join(test_dir, "test_job_bundle")
-            if os.path.exists(test_job_bundle_dir):
-                shutil.rmtree(test_job_bundle_dir)
+    return executor.submit(_compare_job_bundle_output, test_dir, tempdir, timestamp)
+
+
+def _compare_job_bundle_output(test_dir: str, tempdir: str, timestamp: str) -> tuple[bool, str]:
+    """
+    Normalizes the exported job bundle and compares it against the expected one.
+    Runs on a worker thread and touches only files, never the DCC. Returns whether the
+    test succeeded along with its section of the report.
+    """
+    report_fh = io.StringIO()
+    report_fh.write(f"\nTimestamp: {timestamp}\n")
+    report_fh.write(f"Running job bundle output test: {test_dir}\n")
+    try:
+        succeeded = _compare_job_bundle_output_impl(test_dir, tempdir, report_fh)
+    finally:
+        shutil.rmtree(tempdir, ignore_errors=True)
+    return succeeded, report_fh.getvalue()
+
+
+def _compare_job_bundle_output_impl(test_dir: str, tempdir: str, report_fh) -> bool:
+    temp_job_bundle_dir = os.path.join(tempdir, "job_bundle")
+
+    # Process every file in the job bundle to replace the temp dir with a standardized path.
+    # A single compiled alternation covers all four path variants in one pass per file;
+    # the separator-suffixed variants come first so they win over the bare ones.
+    # The replacements are pure ASCII, so operate on bytes and skip the UTF-8
+    # decode/encode round trip entirely
+    tempdir_b = tempdir.encode("utf8")
+    tempdir_fwd = tempdir_b.replace(b"\\", b"/")
+    normalize_pattern = re.compile(
+        b"|".join(
+            re.escape(variant)
+            for variant in (tempdir_b + b"\\", tempdir_fwd + b"/", tempdir_b, tempdir_fwd)
+        )
+    )
+
+    def _normalize_tempdir(match: re.Match) -> bytes:
+        if match.group(0).endswith((b"\\", b"/")):
+            return b"/normalized/job/bundle/dir/"
+        return b"/normalized/job/bundle/dir"
+
+    for filename in os.listdir(temp_job_bundle_dir):
+        full_filename = os.path.join(temp_job_bundle_dir, filename)
+        # One open serves both the read and the rewrite, and files without any tempdir
+        # reference are left untouched
+        with open(full_filename, "r+b") as f:
+            contents = f.read()
+            normalized = normalize_pattern.sub(_normalize_tempdir, contents)
+            if normalized != contents:
+                f.seek(0)
+                f.truncate()
+                f.write(normalized)
+
+    # If there's an expected job bundle to compare with, do the comparison,
+    # otherwise copy the one we created to be that expected job bundle.
+    expected_job_bundle_dir = os.path.join(test_dir, "expected_job_bundle")
+    if os.path.exists(expected_job_bundle_dir):
+        test_job_bundle_dir = os.path.join(test_dir, "test_job_bundle")
+        if os.path.exists(test_job_bundle_dir):
+            shutil.rmtree(test_job_bundle_dir)
+        # Hardlink the files instead of copying their data; the linked inodes survive
+        # the temp directory cleanup. Fall back to a real copy when the temp dir lives
+        # on a different filesystem (or links are otherwise unsupported).
+        try:
+            shutil.copytree(temp_job_bundle_dir, test_job_bundle_dir, copy_function=os.link)
+        except OSError:
+            shutil.rmtree(test_job_bundle_dir, ignore_errors=True)
             shutil.copytree(temp_job_bundle_dir, test_job_bundle_dir)
 
-            dcmp = filecmp.dircmp(expected_job_bundle_dir, test_job_bundle_dir)
-            report_fh.write("\n")
-            report_fh.write(f"{os.path.basename(test_dir)}\n")
-            if dcmp.left_only or dcmp.right_only or dcmp.diff_files:
-                report_fh.write("Test failed, found differences\n")
-                if dcmp.left_only:
-                    report_fh.write(f"Missing files: {dcmp.left_only}\n")
-                if dcmp.right_only:
-                    report_fh.write(f"Extra files: {dcmp.right_only}\n")
-                for file in dcmp.diff_files:
-                    with (
-                        open(os.path.join(expected_job_bundle_dir, file), encoding="utf8") as fleft,
-                        open(os.path.join(test_job_bundle_dir, file), encoding="utf8") as fright,
-                    ):
-                        diff = "".join(
-                            difflib.unified_diff(
-                                list(fleft), list(fright), "expected/" + file, "test/" + file
-                            )
+        dcmp = filecmp.dircmp(expected_job_bundle_dir, test_job_bundle_dir)
+        report_fh.write("\n")
+        report_fh.write(f"{os.path.basename(test_dir)}\n")
+        if dcmp.left_only or dcmp.right_only or dcmp.diff_files:
+            report_fh.write("Test failed, found differences\n")
+            if dcmp.left_only:
+                report_fh.write(f"Missing files: {dcmp.left_only}\n")
+            if dcmp.right_only:
+                report_fh.write(f"Extra files: {dcmp.right_only}\n")
+            for file in dcmp.diff_files:
+                expected_file = os.path.join(expected_job_bundle_dir, file)
+                test_file = os.path.join(test_job_bundle_dir, file)
+                # dircmp's shallow compare keys off stat data, so files rewritten by
+                # the normalization pass can land here with identical contents; a
+                # digest check skips unified_diff's quadratic algorithm for those
+                if _file_sha256(expected_file) == _file_sha256(test_file):
+                    report_fh.write(f"{file}: content matches after normalization\n")
+                    continue
+                diff = _unified_diff(expected_file, test_file, file)
+                if os.path.getsize(expected_file) > _DIFF_TRUNCATE_SIZE:
+                    lines = diff.splitlines(keepends=True)
+                    if len(lines) > _DIFF_TRUNCATE_LINES:
+                        diff = (
+                            "".join(itertools.islice(lines, _DIFF_TRUNCATE_LINES))
+                            + f"... diff truncated after {_DIFF_TRUNCATE_LINES} lines\n"
                         )
-                        report_fh.write(diff)
+                report_fh.write(diff)
 
-                # Failed the test
-                return False
-            else:
-                report_fh.write("Test succeeded\n")
-                # Succeeded the test
-                return True
-        else:
-            shutil.copytree(temp_job_bundle_dir, expected_job_bundle_dir)
-
-            report_fh.write("Test cannot compare. Saved new reference to expected_job_bundle.\n")
-            # We generated the original expected job bundle, so did not succeed a test.
+            # Failed the test
             return False
+        else:
+            report_fh.write("Test succeeded\n")
+            # Succeeded the test
+            return True
+    else:
+        shutil.copytree(temp_job_bundle_dir, expected_job_bundle_dir)
+
+        report_fh.write("Test cannot compare. Saved new reference to expected_job_bundle.\n")
+        # We generated the original expected job bundle, so did not succeed a test.
+        return False
 
 
 if __name__ == "__main__":
@@ -4,15 +4,15 @@
 3ds Max Deadline Cloud Submitter - Create UI
 """
 
+import functools
 import logging
 import math
 import os
-from os.path import abspath, join, normpath
+from concurrent.futures import ThreadPoolExecutor
+from os.path import abspath, isabs, join
 from pathlib import Path
 from typing import Any, Optional
 
-import yaml
-
 import qtmax
 import pymxs  # noqa
 from pymxs import runtime as rt
@@ -20,14 +20,13 @@ from pymxs import runtime as rt
 from PySide2.QtCore import Qt
 
 from deadline.client.job_bundle.submission import AssetReferences
-from deadline.client.job_bundle._yaml import deadline_yaml_dump
 from deadline.client.ui.dialogs._types import JobBundlePurpose
 
 from ui.submit_dialog import SubmitMaxJobToDeadlineDialog
 from ui.scene_settings_tab import SceneSettingsWidget
 from data_classes import RenderSubmitterUISettings, StateSetData
 from sanity_checks import check_sanity
-from create_job_bundle import get_job_template, get_parameters_values
+from create_job_bundle import _clone_template, get_job_template, get_parameters_values
 from utilities import max_utils, submission_utils
 from data_const import (
     ALL_STEREO_CAMERAS_STR,
@@ -40,6 +39,28 @@ from _version import version_tuple as adaptor_version_tuple
 _logger = logging.getLogger(__name__)
 
 
+@functools.lru_cache(maxsize=1)
+def _load_default_template() -> dict:
+    """
+    Parses the bundled default job template; the file never changes for the life of the
+    process, so the parsed dict is memoized
+    """
+    # yaml is only needed here; importing it lazily keeps it off the module import path.
+    # libyaml's C loader parses an order of magnitude faster than the pure-Python one;
+    # fall back when PyYAML was built without it
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as _YamlLoader  # type: ignore[attr-defined]
+    except ImportError:
+        from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
+
+    # Hand the loader raw bytes in one shot; it decodes internally, so this skips
+    # TextIOWrapper's incremental UTF-8 decoding
+    template_bytes = (Path(__file__).parent / "default_max_job_template.yaml").read_bytes()
+    return yaml.load(template_bytes, Loader=_YamlLoader)
+
+
 def show_job_bundle_submitter():
     """
     Main function that shows the UI.
@@ -48,9 +69,8 @@ def show_job_bundle_submitter():
     # Get main max window
     main_window = qtmax.GetQMaxMainWindow()
 
-    # Load default template
-    with open(Path(__file__).parent / "default_max_job_template.yaml") as fh:
-        default_job_template = yaml.safe_load(fh)
+    # Load default template; cloned so later template mutation can't leak into the cache
+    default_job_template = _clone_template(_load_default_template())
 
     render_settings = RenderSubmitterUISettings()
 
@@ -60,28 +80,22 @@ def show_job_bundle_submitter():
     render_settings.project_path = max_utils.get_scene_path()
     render_settings.output_path = max_utils.get_scene_dir()
     render_settings.output_name = max_utils.get_scene_name() + "_###"
-    render_settings.backup_file = rt.execute("GetDir #temp") + "\\" + TEMP_BACKUP_FILENAME
-    render_settings.renderer = str(rt.renderers.current).split(":")[0]
+    # The temp dir doesn't change at runtime; resolve the backup path once and reuse it
+    # in the bundle callback instead of repeating the MAXScript round trip
+    backup_file = os.path.join(rt.execute("GetDir #temp"), TEMP_BACKUP_FILENAME)
+    render_settings.backup_file = backup_file
+    render_settings.renderer = max_utils.get_current_renderer_name()
 
     render_settings.load_sticky_settings()
 
     output_directories: set[str] = set()
 
-    # Add output dir from state set settings if one is set
-    state_sets = max_utils.get_state_set_names()
-    for state_set in state_sets:
-        rt.execute(
-            f"stateSetsDotNetObject = dotNetObject "
-            f'"Autodesk.Max.StateSets.Plugin" \n'
-            f"stateSets = stateSetsDotNetObject.Instance \n"
-            f"masterState = stateSets.EntityManager.RootEntity."
-            f"MasterStateSet \n"
-            f"needState = masterState.Children.Item[{state_set[1]}] \n"
-            f"masterState.CurrentState = #(needState)"
-        )
-        if rt.rendOutputFilename:
-            output = os.path.split(rt.rendOutputFilename)
-            output_directories.update([output[0]])
+    # Add output dir from state set settings if one is set. The batched walk visits
+    # every state set inside a single MAXScript call instead of a pymxs switch plus
+    # read per set
+    for _name, _index, render_output in max_utils.get_state_set_render_outputs():
+        if render_output:
+            output_directories.add(os.path.split(render_output)[0])
     output_directories.update([render_settings.output_path])
     render_settings.output_directories = output_directories
 
@@ -107,13 +121,23 @@ def show_job_bundle_submitter():
             JobBundlePurpose.EXPORT when 'Export Bundle' was pressed
             JobBundlePurpose.SUBMISSION when 'Submit' was pressed
         """
-        # Run all sanity checks
-        check_sanity(settings)
+        # Fetch the state sets once for this submission; the scene can't change between
+        # the sanity checks and building the bundle on the same thread
+        state_sets = max_utils.get_state_set_names()
+
+        # Run all sanity checks. The checks already switch through every submitted state
+        # set, so they hand back a snapshot of each set's renderer, frame range and
+        # render output; building the bundle from those avoids a second switch sweep
+        state_set_snapshots = check_sanity(settings, state_sets)
 
         _logger.debug("Start on_create_job_bundle_callback")
-        settings.backup_file = rt.execute("GetDir #temp") + "\\" + TEMP_BACKUP_FILENAME
+        settings.backup_file = backup_file
         _logger.debug(f"backup file: {settings.backup_file}")
 
+        # The scene may have been edited with the dialog open; re-validate the Asset
+        # Tracking state once per submission, after which the consumers below share it
+        max_utils.mark_ats_dirty()
+
         # Reset in case Max remembered these settings
         submission_utils.backup_saved = False
         submission_utils.clear_mat = False
@@ -121,83 +145,40 @@ def show_job_bundle_submitter():
         submission_utils.custom_mat = False
 
         state_sets_to_submit: list[StateSetData] = []
-        state_sets = max_utils.get_state_set_names()
-        # if all state sets were chosen for submission, make a StateSetData object for each state set
-        if settings.state_set == ALL_STATE_SETS_STR:
-            for state_set in state_sets:
-                # Set the current state set
-                rt.execute(
-                    f"stateSetsDotNetObject = dotNetObject "
-                    f'"Autodesk.Max.StateSets.Plugin" \n'
-                    f"stateSets = stateSetsDotNetObject.Instance \n"
-                    f"masterState = stateSets.EntityManager.RootEntity."
-                    f"MasterStateSet \n"
-                    f"needState = masterState.Children.Item[{state_set[1]}] \n"
-                    f"masterState.CurrentState = #(needState)"
-                )
-                # Check if an output directory is set in render setup dialog
-                if rt.rendOutputFilename:
-                    output_dir = os.path.split(rt.rendOutputFilename)[0]
-                    output_file = os.path.split(rt.rendOutputFilename)[1]
-                    output_file_name = Path(output_file).stem
-                    output_file_format = os.path.splitext(output_file)[1]
-                # If it isn't, use the UI fields data
-                else:
-                    output_dir = settings.output_path
-                    output_file_name = state_set[0] + "_" + settings.output_name
-                    output_file_format = settings.output_ext
-                image_resolution = (rt.renderWidth, rt.renderHeight)
-
-                state_sets_to_submit.append(
-                    StateSetData(
-                        state_set=state_set[0],
-                        renderer=str(rt.renderers.current).split(":")[0],
-                        frame_range=max_utils.get_frames(),
-                        output_directories=output_directories,
-                        output_file_dir=output_dir,
-                        output_file_name=output_file_name,
-                        output_file_format=output_file_format,
-                        image_resolution=image_resolution,
-                        ui_group_label=state_set[0] + " Settings",
-                    )
-                )
-        # Otherwise only create it for the selected state set
-        else:
-            need_state = settings.state_set_index
-            # Set the current state set
-            rt.execute(
-                f"stateSetsDotNetObject = dotNetObject "
-                f'"Autodesk.Max.StateSets.Plugin" \n'
-                f"stateSets = stateSetsDotNetObject.Instance \n"
-                f"masterState = stateSets.EntityManager.RootEntity."
-                f"MasterStateSet \n"
-                f"needState = masterState.Children.Item[{need_state}]\n"
-                f"masterState.CurrentState = #(needState)"
-            )
+        # Make a StateSetData object per snapshot: one per state set when all of them
+        # were chosen for submission, otherwise just one for the selected state set
+        all_state_sets = settings.state_set == ALL_STATE_SETS_STR
+        # The render resolution is scene-global, not per state set; read it once
+        image_resolution = (rt.renderWidth, rt.renderHeight)
+        for snapshot in state_set_snapshots:
             # Check if an output directory is set in render setup dialog
-            if rt.rendOutputFilename:
-                output_dir = os.path.split(rt.rendOutputFilename)[0]
-                output_file = os.path.split(rt.rendOutputFilename)[1]
-                output_file_name = Path(output_file).stem
-                output_file_format = os.path.splitext(output_file)[1]
+            render_output = snapshot["render_output"]
+            if render_output:
+                output_dir, output_file = os.path.split(render_output)
+                output_file_name, output_file_format = os.path.splitext(output_file)
             # If it isn't, use the UI fields data
             else:
                 output_dir = settings.output_path
-                output_file_name = settings.output_name
+                output_file_name = (
+                    snapshot["state_set"] + "_" + settings.output_name
+                    if all_state_sets
+                    else settings.output_name
+                )
                 output_file_format = settings.output_ext
-            image_resolution = (rt.renderWidth, rt.renderHeight)
 
             state_sets_to_submit.append(
                 StateSetData(
-                    state_set=settings.state_set,
-                    renderer=str(rt.renderers.current).split(":")[0],
-                    frame_range=max_utils.get_frames(),
+                    state_set=snapshot["state_set"],
+                    renderer=snapshot["renderer"],
+                    frame_range=snapshot["frame_range"],
                     output_directories=output_directories,
                     output_file_dir=output_dir,
                     output_file_name=output_file_name,
                     output_file_format=output_file_format,
                     image_resolution=image_resolution,
-                    ui_group_label=UI_GROUP_LABEL,
+                    ui_group_label=(
+                        snapshot["state_set"] + " Settings" if all_state_sets else UI_GROUP_LABEL
+                    ),
                 )
             )
 
@@ -208,11 +189,23 @@ def show_job_bundle_submitter():
 
         # Only do these actions when we want to submit a scene
         if purpose == JobBundlePurpose.SUBMISSION:
-            # Make a backup of the current state of the scene
-            if os.path.exists(settings.backup_file):
-                os.remove(settings.backup_file)
-            submission_utils.save_max_backup_file(settings.backup_file, True)
-            _logger.debug("Saving backup")
+            # Make a backup of the current state of the scene. A .max backup can be
+            # hundreds of MB, so skip the rewrite when it's guaranteed current: no
+            # unsaved changes in memory and the backup on disk is newer than the scene
+            # file (a previous submission of this unchanged scene wrote it)
+            scene_file = rt.maxFilePath + rt.maxFileName
+            backup_is_current = (
+                not rt.getSaveRequired()
+                and os.path.exists(settings.backup_file)
+                and os.path.getmtime(settings.backup_file) >= os.path.getmtime(scene_file)
+            )
+            if not backup_is_current:
+                if os.path.exists(settings.backup_file):
+                    os.remove(settings.backup_file)
+                submission_utils.save_max_backup_file(settings.backup_file, True)
+                _logger.debug("Saving backup")
+            else:
+                _logger.debug("Backup already matches the scene, skipping re-save")
             submission_utils.backup_saved = True
             submission_utils.backup_file = settings.backup_file
 
@@ -260,19 +253,36 @@ def show_job_bundle_submitter():
             for step in job_template["steps"]:
                 step["hostRequirements"] = host_requirements
 
-        # write template, parameter_values and asset_references file
-        with open(job_bundle_path / "template.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump(job_template, f, indent=1)
-
-        with open(job_bundle_path / "parameter_values.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump({"parameterValues": parameter_values}, f, indent=1)
-        with open(job_bundle_path / "asset_references.yaml", "w", encoding="utf8") as f:
-            deadline_yaml_dump(asset_references.to_dict(), f, indent=1)
+        # The dumper drags in the whole yaml emitter stack; only the bundle write needs it
+        from deadline.client.job_bundle._yaml import deadline_yaml_dump
+
+        # write template, parameter_values and asset_references file. The emitter makes
+        # many small writes; a 1 MiB buffer coalesces them into a handful of syscalls.
+        # The three files are independent, so their serialization and disk writes run
+        # on a small thread pool to overlap I/O with the other payloads' emit work
+        def _dump_bundle_file(item: tuple[Path, Any]) -> None:
+            path, obj = item
+            with open(path, "w", encoding="utf8", buffering=1 << 20) as f:
+                deadline_yaml_dump(obj, f, indent=1)
+
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            list(
+                executor.map(
+                    _dump_bundle_file,
+                    [
+                        (job_bundle_path / "template.yaml", job_template),
+                        (
+                            job_bundle_path / "parameter_values.yaml",
+                            {"parameterValues": parameter_values},
+                        ),
+                        (job_bundle_path / "asset_references.yaml", asset_references.to_dict()),
+                    ],
+                )
+            )
 
         attachments: AssetReferences = widget.job_attachments.attachments
         settings.input_filenames = sorted(attachments.input_filenames)
         settings.input_directories = sorted(attachments.input_directories)
-        settings.input_filenames = sorted(attachments.input_filenames)
 
         # Save sticky settings
         settings.save_sticky_settings()
@@ -280,8 +290,12 @@ def show_job_bundle_submitter():
     # Fill in the auto-detected input files
     auto_detected_attachments = AssetReferences()
     relative_dir_base = rt.maxFilePath
+    # abspath normalizes on its own, so the normpath pass per path was redundant. The
+    # base gets its trailing separator once up front, turning the per-path join into a
+    # plain concat; absolute references skip it entirely
+    base = join(relative_dir_base, "")
     input_files: set[str] = {
-        abspath(normpath(join(relative_dir_base, path)))
+        abspath(path) if isabs(path) else abspath(base + path)
         for path in max_utils.get_referenced_files()
     }
     auto_detected_attachments.input_filenames = input_files
@@ -13,7 +13,6 @@ from PySide2.QtWidgets import QMessageBox
 from deadline.client.config import config_file
 
 from utilities.log_utils import configure_logging
-from max_render_submitter import show_job_bundle_submitter
 
 
 def show_ui():
@@ -37,6 +36,10 @@ def show_ui():
         if return_value == QMessageBox.Ok:
             return
 
+    # Imported here so the unsaved-scene popup doesn't pay for the submitter's heavy
+    # imports (qtmax, yaml, the deadline client UI) that only matter once we open it
+    from max_render_submitter import show_job_bundle_submitter
+
     show_job_bundle_submitter()
 
 
@@ -4,6 +4,8 @@
 3ds Max Deadline Cloud Submitter - Sanity checks for job bundle creation
 """
 
+from typing import Optional
+
 import pymxs  # noqa
 from pymxs import runtime as rt
 
@@ -17,11 +19,19 @@ from data_const import (
 )
 
 
-def check_sanity(settings: RenderSubmitterUISettings):
+def check_sanity(
+    settings: RenderSubmitterUISettings, state_sets: Optional[list] = None
+) -> list[dict]:
     """
     All sanity checks that need to be performed at submission.
 
     :param settings: a RenderSubmitterUISettings object containing the latest UI settings
+    :param state_sets: the state sets in the scene as returned by
+        max_utils.get_state_set_names; fetched here when not given, so callers that
+        already walked the state set tree don't trigger a second walk
+    :returns: a snapshot dict per checked state set (see _snapshot_active_state_set), so
+        the bundle callback can reuse the pymxs reads made during the checks instead of
+        switching through every state set a second time
     """
     # Check if 3ds Max scene is saved
     # -> Still needed because you can open a new scene with the UI open
@@ -32,7 +42,7 @@ def check_sanity(settings: RenderSubmitterUISettings):
     rt.checkForSave()
 
     check_sanity_cameras(settings)
-    check_sanity_state_sets(settings)
+    state_set_snapshots = check_sanity_state_sets(settings, state_sets)
 
     if settings.override_frame_range:
         if not settings.frame_list:
@@ -43,16 +53,36 @@ def check_sanity(settings: RenderSubmitterUISettings):
                 "is smaller than the second number. \n"
                 "E.g.: 10-5 is invalid, 5-10 is valid."
             )
-        if max_utils.get_duplicate_frames(settings.frame_list):
+        duplicate_frames = max_utils.get_duplicate_frames(settings.frame_list)
+        if duplicate_frames:
             raise Exception(
                 "You entered an invalid frame range. Please make sure there are no duplicate frames in "
                 "your range. \n"
-                f"Duplicate frames: {max_utils.get_duplicate_frames(settings.frame_list)}"
+                f"Duplicate frames: {duplicate_frames}"
             )
 
     if not settings.name:
         raise Exception("No Job Name was given")
 
+    return state_set_snapshots
+
+
+def _snapshot_active_state_set(name: str, index: int) -> dict:
+    """
+    Captures the pymxs reads the bundle callback needs for the currently active state
+    set, so they happen once per state set switch.
+
+    :param name: the name of the active state set
+    :param index: the index of the active state set
+    """
+    return {
+        "state_set": name,
+        "index": index,
+        "renderer": max_utils.get_current_renderer_name(),
+        "frame_range": max_utils.get_frames(),
+        "render_output": rt.rendOutputFilename,
+    }
+
 
 def check_sanity_cameras(settings: RenderSubmitterUISettings):
     """
@@ -81,27 +111,26 @@ def check_sanity_cameras(settings: RenderSubmitterUISettings):
             )
 
 
-def check_sanity_state_sets(settings: RenderSubmitterUISettings):
+def check_sanity_state_sets(
+    settings: RenderSubmitterUISettings, state_sets: Optional[list] = None
+) -> list[dict]:
     """
     All state set sanity checks.
 
     :param settings: a RenderSubmitterUISettings object containing the latest UI settings
+    :param state_sets: the state sets in the scene, fetched here when not given
+    :returns: a snapshot dict per checked state set
     """
-    state_sets = max_utils.get_state_set_names()
+    if state_sets is None:
+        state_sets = max_utils.get_state_set_names()
     state_set_names = [state[0] for state in state_sets]
+    snapshots: list[dict] = []
     if settings.state_set == ALL_STATE_SETS_STR:
         for state_set in state_sets:
             # Set the current state set
-            rt.execute(
-                f"stateSetsDotNetObject = dotNetObject "
-                f'"Autodesk.Max.StateSets.Plugin" \n'
-                f"stateSets = stateSetsDotNetObject.Instance \n"
-                f"masterState = stateSets.EntityManager.RootEntity."
-                f"MasterStateSet \n"
-                f"needState = masterState.Children.Item[{state_set[1]}] \n"
-                f"masterState.CurrentState = #(needState)"
-            )
+            max_utils.set_active_state_set(state_set[1])
             check_sanity_specific_state_set(settings, state_set[0])
+            snapshots.append(_snapshot_active_state_set(state_set[0], state_set[1]))
 
     else:
         # Check if the selected state set still exists i.e. it wasn't deleted or renamed with the UI open
@@ -113,16 +142,11 @@ def check_sanity_state_sets(settings: RenderSubmitterUISettings):
             )
         need_state = settings.state_set_index
         # Set the current state set
-        rt.execute(
-            f"stateSetsDotNetObject = dotNetObject "
-            f'"Autodesk.Max.StateSets.Plugin" \n'
-            f"stateSets = stateSetsDotNetObject.Instance \n"
-            f"masterState = stateSets.EntityManager.RootEntity."
-            f"MasterStateSet \n"
-            f"needState = masterState.Children.Item[{need_state}]\n"
-            f"masterState.CurrentState = #(needState)"
-        )
+        max_utils.set_active_state_set(need_state)
         check_sanity_specific_state_set(settings, settings.state_set)
+        snapshots.append(_snapshot_active_state_set(settings.state_set, need_state))
+
+    return snapshots
 
 
 def check_sanity_specific_state_set(settings: RenderSubmitterUISettings, state_set: str):
@@ -132,26 +156,28 @@ def check_sanity_specific_state_set(settings: RenderSubmitterUISettings, state_s
     :param settings: a RenderSubmitterUISettings object containing the latest UI settings
     :param state_set: the name of the active state set
     """
-    if str(rt.renderers.current).split(":")[0] not in ALLOWED_RENDERERS:
-        raise Exception(
-            f"{state_set} has an unsupported renderer set. Renderer: "
-            f"{str(rt.renderers.current).split(':')[0]}"
-        )
+    # One pymxs read and one split shared by the membership test and the error message
+    renderer = max_utils.get_current_renderer_name()
+    if renderer not in ALLOWED_RENDERERS:
+        raise Exception(f"{state_set} has an unsupported renderer set. Renderer: {renderer}")
 
     if not settings.override_frame_range:
         # Only check for valid input when pick up frames is selected
         if rt.rendTimeType == 4:
-            if not max_utils.is_correct_frame_range(max_utils.get_frames()):
+            # get_frames walks the Max time configuration; do it once for both checks
+            frames = max_utils.get_frames()
+            if not max_utils.is_correct_frame_range(frames):
                 raise Exception(
                     f"{state_set} has an invalid frame range. Please make sure that the first number in the"
                     " range is smaller than the second number. \n"
                     "E.g.: 10-5 is invalid, 5-10 is valid."
                 )
-            if max_utils.get_duplicate_frames(max_utils.get_frames()):
+            duplicate_frames = max_utils.get_duplicate_frames(frames)
+            if duplicate_frames:
                 raise Exception(
                     f"{state_set} has an invalid frame range. Please make sure there are no duplicate "
                     "frames in your range. \n"
-                    f"Duplicate frames: {max_utils.get_duplicate_frames(max_utils.get_frames())}"
+                    f"Duplicate frames: {duplicate_frames}"
                 )
 
     if not rt.rendOutputFilename:
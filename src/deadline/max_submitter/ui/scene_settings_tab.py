@@ -11,7 +11,7 @@ import pymxs  # noqa
 from pymxs import runtime as rt
 
 from PySide2.QtGui import QRegularExpressionValidator
-from PySide2.QtCore import QSize, Qt, QRegularExpression  # type: ignore
+from PySide2.QtCore import QSize, Qt, QRegularExpression, Slot  # type: ignore
 from PySide2.QtWidgets import (  # type: ignore
     QCheckBox,
     QComboBox,
@@ -34,14 +34,44 @@ from deadline.client.ui import block_signals
 from utilities import max_utils
 from data_const import (
     ALLOWED_RENDERERS,
-    ALLOWED_EXTENSIONS,
+    ALLOWED_EXTENSION_LABELS,
+    ALLOWED_EXTENSION_SUFFIXES,
     SCENE_TWEAKS_MATS,
-    STEREO_CAMERA_OPTIONS,
+    STEREO_CAMERA_OPTION_LABELS,
+    STEREO_CAMERA_OPTION_VALUES,
     ALL_STATE_SETS_STR,
 )
 
 _logger = logging.getLogger(__name__)
 
+_UNSUPPORTED_RENDERER_TEXT = "Current Renderer not supported by Submitter"
+
+# Frame range validation pattern, e.g.: 1-4,6,8,9-12
+# Note: ?: in regex groups all together as one result
+# Compiled (and JIT-optimized) once at import; dialog open/close cycles reuse it
+_FRAME_RANGE_RE = QRegularExpression(
+    r"\d+"  # unlimited numbers
+    r"(?:-\d+)?"  # optional dash (-) and one or more digits
+    r"(?:,(\s)?\d+"  # new parts split by commas (,) , allow 1 space for readability
+    r"(?:-\d+)?)*"
+)  # can be repeated endlessly
+_FRAME_RANGE_RE.optimize()
+
+
+def _bulk_add_items(combo: QComboBox, pairs) -> None:
+    """
+    Add (label, data) pairs to a combo box in one batch.
+
+    Every individual addItem fires the combo's change signals, so attached handlers
+    run once per row; suppressing the combo's signals for the duration of the loop
+    collapses that into one update. The model's signals are left alone on purpose:
+    QComboBox's own rowsInserted handling is what auto-selects item 0 when a box is
+    filled from empty.
+    """
+    with block_signals(combo):
+        for label, data in pairs:
+            combo.addItem(label, data)
+
 
 class FileSearchLineEdit(QWidget):
     """
@@ -117,18 +147,53 @@ class SceneSettingsWidget(QWidget):
         self.renderers = max_utils.get_renderers()
         self.state_sets = max_utils.get_state_set_names()
 
+        # The camera enumerations walk the whole scene through pymxs, so their results
+        # are cached and reused until Max reports that the scene changed
+        self._camera_cache: dict = {}
+        # True while the initial settings are being applied; the change slots early
+        # return so bulk setup doesn't fire them once per field
+        self._loading = False
+        # Last frame range content that went through validation; focusChanged fires on
+        # every focus transition in the app, so identical content is not re-parsed
+        self._last_validated_text = None
+
         self._build_ui(initial_settings)
         self._configure_settings(initial_settings)
 
         # Assign callback that updates the renderer in the UI each time it changes in the render settings
         rt.pyCallback = self._update_renderer
-        rt.callbacks.addScript(rt.Name("postRendererChange"), "pyCallback()")
+        rt.callbacks.addScript(
+            rt.Name("postRendererChange"),
+            "pyCallback()",
+            id=rt.Name("DeadlineCloudRendererChange"),
+        )
+        # Drop the cached camera lists whenever the scene contents can have changed
+        rt.pyCameraCacheCallback = self._camera_cache.clear
+        for event in ("nodeCreated", "nodeDeleted", "filePostOpen", "systemPostNew"):
+            rt.callbacks.addScript(
+                rt.Name(event),
+                "pyCameraCacheCallback()",
+                id=rt.Name("DeadlineCloudCameraCache"),
+            )
         QApplication.instance().focusChanged.connect(self.on_focus_changed)
 
+    def _cached_cameras(self, key: str, fn):
+        """
+        Return the cached camera enumeration for key, populating it with fn on a miss.
+        """
+        try:
+            return self._camera_cache[key]
+        except KeyError:
+            value = self._camera_cache[key] = fn()
+            return value
+
     def _build_ui(self, settings):
         """
         Function that creates all the Qt UI elements for the job specific settings tab
         """
+        # Coalesce the geometry update each addWidget schedules into one layout pass
+        # when updates are re-enabled at the end of the build
+        self.setUpdatesEnabled(False)
         lyt = QGridLayout(self)
 
         # Project path
@@ -149,19 +214,22 @@ class SceneSettingsWidget(QWidget):
 
         # Output extension
         self.output_ext_box = QComboBox(self)
-        for ext in ALLOWED_EXTENSIONS:
-            self.output_ext_box.addItem(ext[0], ext[1])
+        _bulk_add_items(
+            self.output_ext_box, zip(ALLOWED_EXTENSION_LABELS, ALLOWED_EXTENSION_SUFFIXES)
+        )
         lyt.addWidget(QLabel("Output File Extension"), 3, 0)
         lyt.addWidget(self.output_ext_box, 3, 1)
 
         # State Set selection
         self.state_sets_box = QComboBox(self)
-        self.state_sets_box.addItem("All State Sets", "All State Sets")
         self.state_sets_box.setToolTip(
             "Updating this selection also updates the active state set of your scene."
         )
-        for state_set in self.state_sets:
-            self.state_sets_box.addItem(state_set[0], state_set[1])
+        _bulk_add_items(
+            self.state_sets_box,
+            [("All State Sets", "All State Sets")]
+            + [(state_set[0], state_set[1]) for state_set in self.state_sets],
+        )
         lyt.addWidget(QLabel("State Sets"), 4, 0)
         lyt.addWidget(self.state_sets_box, 4, 1)
         (self.state_sets_box.currentIndexChanged.connect(self._update_state_set))
@@ -173,10 +241,14 @@ class SceneSettingsWidget(QWidget):
             "Needs to be set in Render Settings! \n"
             "If you are using State Sets, be sure to record any changes in the State Set."
         )
-        self.renderers_box.addItem("Current Renderer not supported by Submitter")
-        for renderer in self.renderers:
-            if renderer in ALLOWED_RENDERERS:
-                self.renderers_box.addItem(renderer.replace("_", " "), renderer)
+        _bulk_add_items(
+            self.renderers_box,
+            (
+                (renderer.replace("_", " "), renderer)
+                for renderer in self.renderers
+                if renderer in ALLOWED_RENDERERS
+            ),
+        )
         lyt.addWidget(QLabel("Renderer"), 5, 0)
         lyt.addWidget(self.renderers_box, 5, 1)
 
@@ -185,8 +257,10 @@ class SceneSettingsWidget(QWidget):
         # Checks for use and installation of the stereo camera plugin
         # If it is used and loaded: give user all stereo camera options
         if max_utils.stereo_plugin_used_and_loaded():
-            for option in STEREO_CAMERA_OPTIONS:
-                self.stereo_cameras_box.addItem(option[0], option[1])
+            _bulk_add_items(
+                self.stereo_cameras_box,
+                zip(STEREO_CAMERA_OPTION_LABELS, STEREO_CAMERA_OPTION_VALUES),
+            )
             self.stereo_cameras_box.setEnabled(True)
         # If it is used but not loaded: only give all or none option
         # Note: in this case left and right only get displaced visually, so there's no way to differentiate between
@@ -214,21 +288,15 @@ class SceneSettingsWidget(QWidget):
         self.frame_override_txt.setToolTip(
             "Frame range you want to use as override. \n" "E.g. 1,3,5-10 or 1, 3, 5-10"
         )
-        self.style_sheet = self.frame_override_txt.styleSheet()
+        # One stylesheet parsed at build time; validation toggles the 'error' dynamic
+        # property instead of handing Qt new CSS to re-parse on every result
+        self.frame_override_txt.setStyleSheet('QLineEdit[error="true"] { background-color: red; }')
         lyt.addWidget(self.frame_override_chck, 8, 0)
         lyt.addWidget(self.frame_override_txt, 8, 1)
         self.frame_override_chck.stateChanged.connect(self.activate_frame_override_changed)
 
         # Frame range validation
-        # E.g.: 1-4,6,8,9-12
-        # Note: ?: in regex groups all together as one result
-        regex = QRegularExpression(
-            r"\d+"  # unlimited numbers
-            r"(?:-\d+)?"  # optional dash (-) and one or more digits
-            r"(?:,(\s)?\d+"  # new parts split by commas (,) , allow 1 space for readability
-            r"(?:-\d+)?)*"
-        )  # can be repeated endlessly
-        validator = QRegularExpressionValidator(regex, self.frame_override_txt)
+        validator = QRegularExpressionValidator(_FRAME_RANGE_RE, self.frame_override_txt)
         self.frame_override_txt.setValidator(validator)
 
         # Scene tweaks group box
@@ -243,7 +311,7 @@ class SceneSettingsWidget(QWidget):
 
         lyt.addItem(QSpacerItem(0, 0, QSizePolicy.Minimum, QSizePolicy.Expanding), 13, 0)
 
-        self._fill_cameras_box(0)
+        self.setUpdatesEnabled(True)
 
     def _build_scene_tweaks_ui(self):
         """
@@ -252,7 +320,9 @@ class SceneSettingsWidget(QWidget):
         # Create groupbox
         self.scene_tweaks_grp_box = QGroupBox()
         self.scene_tweaks_grp_box.setTitle("Scene Tweaks")
-        scene_tweaks_lyt = QGridLayout(self)
+        # Parentless layout: setLayout parents it to the group box; passing self here
+        # double-parented the layout and forced Qt to reparent it
+        scene_tweaks_lyt = QGridLayout()
         self.scene_tweaks_grp_box.setLayout(scene_tweaks_lyt)
 
         # Merge XRef Objects check box
@@ -281,34 +351,31 @@ class SceneSettingsWidget(QWidget):
 
         # Custom Material combo box
         self.custom_mat_box = QComboBox(self)
-        for mat in SCENE_TWEAKS_MATS:
-            self.custom_mat_box.addItem(mat, mat)
+        _bulk_add_items(self.custom_mat_box, ((mat, mat) for mat in SCENE_TWEAKS_MATS))
         scene_tweaks_lyt.addWidget(self.custom_mat_box, 3, 1)
 
+    @Slot(int)
     def _update_state_set(self, _):
         """
         Set the active state set based on the currently selected option in the ui
         """
+        if self._loading:
+            return
         index = self.state_sets_box.currentData()
         if index == ALL_STATE_SETS_STR:
             _logger.debug("All State Sets selected in UI")
             return
         # Set the current state set
-        rt.execute(
-            f"stateSetsDotNetObject = dotNetObject "
-            f'"Autodesk.Max.StateSets.Plugin" \n'
-            f"stateSets = stateSetsDotNetObject.Instance \n"
-            f"masterState = stateSets.EntityManager.RootEntity."
-            f"MasterStateSet \n"
-            f"needState = masterState.Children.Item[{index}]\n"
-            f"masterState.CurrentState = #(needState)"
-        )
+        max_utils.set_active_state_set(index)
 
+    @Slot(int)
     def _fill_cameras_box(self, _):
         """
         Fill the Cameras combo box based on the selected value in the Stereo
         Cameras combo box
         """
+        if self._loading:
+            return
         with block_signals(self.cameras_box):
             # Save previously selected camera to be able to reselect it later
             saved_camera = self.cameras_box.currentData()
@@ -317,17 +384,23 @@ class SceneSettingsWidget(QWidget):
             self.cameras_box.clear()
             self.cameras_box.addItem("All Cameras in List", "All Cameras")
 
-            # Collect all cameras in the scene
-            self.cameras = max_utils.get_camera_names()
+            # Collect all cameras in the scene. Kept as an insertion-ordered dict so the
+            # stereo filter can drop entries in O(1) while population order is preserved;
+            # fromkeys also copies, so trimming never touches the cache
+            self.cameras = dict.fromkeys(
+                self._cached_cameras("camera_names", max_utils.get_camera_names)
+            )
 
             # Collect all stereo cameras in the scene
-            all_stereo_cameras = max_utils.get_stereo_camera_names()
+            all_stereo_cameras = [
+                cam[0]
+                for cam in self._cached_cameras("stereo_cameras", max_utils.get_stereo_cameras)
+            ]
 
             # Check if there are any stereo cameras present in the scene
             if not all_stereo_cameras:
                 _logger.info("There are no stereo cameras in the scene")
-                for camera_name in self.cameras:
-                    self.cameras_box.addItem(camera_name, camera_name)
+                _bulk_add_items(self.cameras_box, ((name, name) for name in self.cameras))
 
                 # if previously selected still in list, reselect
                 index = self.cameras_box.findData(saved_camera)
@@ -341,8 +414,7 @@ class SceneSettingsWidget(QWidget):
             self._fill_cameras_box_stereo(all_stereo_cameras)
 
             # Append the selectable cameras to the combo box
-            for camera_name in self.cameras:
-                self.cameras_box.addItem(camera_name, camera_name)
+            _bulk_add_items(self.cameras_box, ((name, name) for name in self.cameras))
 
             # If previously selected still in list, reselect
             index = self.cameras_box.findData(saved_camera)
@@ -353,47 +425,48 @@ class SceneSettingsWidget(QWidget):
         """
         Update the cameras and stereo_cameras variables according to the stereo camera selection.
         """
-        # Split up the stereo cameras
-        left_cams = max_utils.get_left_stereo_camera_names()
-        right_cams = max_utils.get_right_stereo_camera_names()
-        center_cams = max_utils.get_center_stereo_camera_names()
+        # Split up the stereo cameras; the eyes are derived in Python from the cached
+        # stereo pairs instead of walking the scene once per eye
+        stereo_pairs = self._cached_cameras("stereo_cameras", max_utils.get_stereo_cameras)
+        left_cams = [cam[0] for cam in stereo_pairs if cam[1][0] < 0]
+        right_cams = [cam[0] for cam in stereo_pairs if cam[1][0] > 0]
+        center_cams = [cam[0] for cam in stereo_pairs if cam[1][0] == 0]
 
         # Value for easily assigning them to scene settings object
-        self.stereo_cameras = max_utils.get_stereo_camera_names()
+        self.stereo_cameras = dict.fromkeys(all_stereo_cameras)
 
-        _logger.debug(
-            f"Changing Camera Selection filter: '{self.stereo_cameras_box.currentText()}'"
-        )
-        cams_to_remove = []
-        # Determine the list of selectable cameras
-        if self.stereo_cameras_box.currentData() == "None":
+        selection = self.stereo_cameras_box.currentData()
+        selection_text = self.stereo_cameras_box.currentText()
+        _logger.debug("Changing Camera Selection filter: '%s'", selection_text)
+        if selection == "None":
             _logger.info("Changing Camera Selection filter to include No Stereo Cameras")
-            cams_to_remove = all_stereo_cameras
         # Only add all stereo cameras option if stereo cameras are allowed for submission
         else:
             self.cameras_box.addItem("All Stereo Cameras in List", "All Stereo Cameras")
             _logger.info(
-                "Changing Camera Selection filter to include "
-                f"{self.stereo_cameras_box.currentText()} from the Stereo Cameras"
+                "Changing Camera Selection filter to include %s from the Stereo Cameras",
+                selection_text,
             )
 
-        if self.stereo_cameras_box.currentData() == "Left":
-            cams_to_remove = right_cams + center_cams
-
-        if self.stereo_cameras_box.currentData() == "Right":
-            cams_to_remove = left_cams + center_cams
-
-        if self.stereo_cameras_box.currentData() == "Center":
-            cams_to_remove = right_cams + left_cams
-
-        if self.stereo_cameras_box.currentData() == "Left_Right":
-            cams_to_remove = center_cams
-
-        if cams_to_remove:
-            for cam in cams_to_remove:
-                self.cameras.remove(cam)
-                self.stereo_cameras.remove(cam)
-
+        # Determine the list of selectable cameras; a single dict dispatch on the
+        # selection replaces the branch cascade, and only the selected entry's lists
+        # get concatenated
+        remove_by_selection = {
+            "None": (all_stereo_cameras,),
+            "Left": (right_cams, center_cams),
+            "Right": (left_cams, center_cams),
+            "Center": (right_cams, left_cams),
+            "Left_Right": (center_cams,),
+        }
+        cams_to_remove = [cam for part in remove_by_selection.get(selection, ()) for cam in part]
+
+        # Dropping a key from the ordered dicts is O(1) per filtered camera, against
+        # the O(N) scan a list.remove would cost
+        for cam in cams_to_remove:
+            self.cameras.pop(cam, None)
+            self.stereo_cameras.pop(cam, None)
+
+    @Slot("QWidget*", "QWidget*")
     def on_focus_changed(self, old_widget, new_widget):
         """
         Event handler for when the active widget changes.
@@ -404,13 +477,24 @@ class SceneSettingsWidget(QWidget):
         :param new_widget: widget that gained focus
         :type new_widget: any QWidget
         """
+        # Cheap exit for stale-but-still-connected instances; focusChanged is app-wide
+        if not self.isVisible():
+            return
+
         if self.frame_override_txt is not old_widget:
             return
 
-        if not self.frame_override_txt.text():
+        text = self.frame_override_txt.text()
+        # Rapid focus flicker re-delivers the same content; skip re-parsing what was
+        # already validated (and already warned about)
+        if text and text == self._last_validated_text:
+            return
+        self._last_validated_text = text
+
+        if not text:
             # color text field red and show a message box
             _logger.error("No frame range inputted")
-            self.frame_override_txt.setStyleSheet("background-color: red")
+            self._set_frame_override_error(True)
             QMessageBox.warning(
                 self,
                 "Empty Frame Range",
@@ -418,10 +502,10 @@ class SceneSettingsWidget(QWidget):
             )
             return
 
-        if not max_utils.is_correct_frame_range(self.frame_override_txt.text()):
+        if not max_utils.is_correct_frame_range(text):
             # color text field red and show a message box
             _logger.error("Not a correct frame range")
-            self.frame_override_txt.setStyleSheet("background-color: red")
+            self._set_frame_override_error(True)
             QMessageBox.warning(
                 self,
                 "Invalid Frame Range",
@@ -431,25 +515,61 @@ class SceneSettingsWidget(QWidget):
             )
             return
 
-        if max_utils.get_duplicate_frames(self.frame_override_txt.text()):
+        duplicate_frames = max_utils.get_duplicate_frames(text)
+        if duplicate_frames:
             # color text field red and show a message box
             _logger.error("Not a correct frame range")
-            self.frame_override_txt.setStyleSheet("background-color: red")
+            self._set_frame_override_error(True)
             QMessageBox.warning(
                 self,
                 "Invalid Frame Range",
-                "You have duplicate frames. Duplicate frames: "
-                f"{max_utils.get_duplicate_frames(self.frame_override_txt.text())}",
+                f"You have duplicate frames. Duplicate frames: {duplicate_frames}",
             )
             return
 
-        self.frame_override_txt.setStyleSheet(self.style_sheet)
+        self._set_frame_override_error(False)
+
+    def _select_renderer(self, renderer) -> None:
+        """
+        Select the given renderer in the renderers box. The 'not supported' placeholder
+        only exists while an unsupported renderer is active, so the common supported
+        case keeps the item list one entry shorter and findData off the placeholder.
+        """
+        has_placeholder = self.renderers_box.itemText(0) == _UNSUPPORTED_RENDERER_TEXT
+        index = self.renderers_box.findData(renderer)
+        if index >= 0:
+            if has_placeholder:
+                self.renderers_box.removeItem(0)
+                index -= 1
+            self.renderers_box.setCurrentIndex(index)
+        else:
+            if not has_placeholder:
+                self.renderers_box.insertItem(0, _UNSUPPORTED_RENDERER_TEXT)
+            self.renderers_box.setCurrentIndex(0)
+
+    @staticmethod
+    def _set_by_data(box: QComboBox, data) -> None:
+        """
+        Select the combo box entry holding data. Skips both the findData scan and the
+        change signal when the entry is already current, and blocks the signal for the
+        actual assignment so setup never dispatches the change slots through Qt.
+        """
+        if box.currentData() == data:
+            return
+        index = box.findData(data)
+        if index >= 0:
+            with block_signals(box):
+                box.setCurrentIndex(index)
 
     def _configure_settings(self, settings):
         """
         Set the initial status of the ui fields
         """
-        settings.renderer = str(rt.renderers.current).split(":")[0]
+        # Suppress the change slots while the initial values are applied; every
+        # setCurrentIndex below would otherwise fire _update_state_set (a MAXScript
+        # round trip) or _fill_cameras_box (a scene walk) once per field
+        self._loading = True
+        settings.renderer = max_utils.get_current_renderer_name()
         self.proj_path_txt.setText(settings.project_path)
         self.output_path_txt.setText(settings.output_path)
         self.output_name_txt.setText(settings.output_name)
@@ -457,25 +577,10 @@ class SceneSettingsWidget(QWidget):
         self.frame_override_txt.setEnabled(settings.override_frame_range)
         self.frame_override_txt.setText(settings.frame_list)
 
-        index = self.output_ext_box.findData(settings.output_ext)
-        if index >= 0:
-            self.output_ext_box.setCurrentIndex(index)
-
-        index = self.state_sets_box.findData(settings.state_set)
-        if index >= 0:
-            self.state_sets_box.setCurrentIndex(index)
-
-        index = self.renderers_box.findData(settings.renderer)
-        if index >= 0:
-            self.renderers_box.setCurrentIndex(index)
-
-        index = self.stereo_cameras_box.findData(settings.stereo_camera)
-        if index >= 0:
-            self.stereo_cameras_box.setCurrentIndex(index)
-
-        index = self.cameras_box.findData(settings.camera_selection)
-        if index >= 0:
-            self.cameras_box.setCurrentIndex(index)
+        self._set_by_data(self.output_ext_box, settings.output_ext)
+        self._set_by_data(self.state_sets_box, settings.state_set)
+        self._select_renderer(settings.renderer)
+        self._set_by_data(self.stereo_cameras_box, settings.stereo_camera)
 
         self.merge_xref_obj_chck.setChecked(settings.merge_xref_obj)
         self.merge_xref_scn_chck.setChecked(settings.merge_xref_scn)
@@ -484,13 +589,17 @@ class SceneSettingsWidget(QWidget):
         self.custom_mat_chck.setChecked(settings.custom_mat_chck)
         self.custom_mat_box.setEnabled(settings.custom_mat_chck)
 
-        index = self.custom_mat_box.findData(settings.custom_mat)
-        if index >= 0:
-            self.custom_mat_box.setCurrentIndex(index)
+        self._set_by_data(self.custom_mat_box, settings.custom_mat)
 
         if self.developer_options:
             (self.include_adaptor_wheels.setChecked(settings.include_adaptor_wheels))
 
+        self._loading = False
+        # Fill the cameras box exactly once, with the stereo selection already applied,
+        # then restore the saved camera selection
+        self._fill_cameras_box(0)
+        self._set_by_data(self.cameras_box, settings.camera_selection)
+
     def update_settings(self, settings):
         """
         Update a scene settings object with the latest values.
@@ -509,8 +618,10 @@ class SceneSettingsWidget(QWidget):
 
         settings.stereo_camera = self.stereo_cameras_box.currentData()
         settings.camera_selection = self.cameras_box.currentData()
-        settings.all_cameras = self.cameras
-        settings.all_stereo_cameras = self.stereo_cameras
+        # The camera collections are ordered dicts internally; hand the settings plain
+        # lists at the boundary
+        settings.all_cameras = list(self.cameras)
+        settings.all_stereo_cameras = list(self.stereo_cameras)
 
         settings.merge_xref_obj = self.merge_xref_obj_chck.isChecked()
         settings.merge_xref_scn = self.merge_xref_scn_chck.isChecked()
@@ -524,27 +635,51 @@ class SceneSettingsWidget(QWidget):
         else:
             settings.include_adaptor_wheels = False
 
+    @Slot(int)
     def activate_frame_override_changed(self, state):
         """
         Set the activated/deactivated status of the Frame override text box
         """
         self.frame_override_txt.setEnabled(state == Qt.Checked)
 
+    @Slot(int)
     def activate_custom_material_changed(self, state):
         """
         Set the activated/deactivated status of the Custom material combo box
         """
         self.custom_mat_box.setEnabled(state == Qt.Checked)
 
+    @Slot()
     def _update_renderer(self):
         """
         Gets the current renderer from the render settings and set it in the UI
         """
         _logger.debug("Renderer updated in Render Settings")
-        renderer = str(rt.renderers.current).split(":")[0]
-        index = self.renderers_box.findData(renderer)
-        if index >= 0:
-            self.renderers_box.setCurrentIndex(index)
-        # If the selected renderer isn't in the list set it to the 'Renderer not supported' option
-        else:
-            self.renderers_box.setCurrentIndex(0)
+        self._select_renderer(max_utils.get_current_renderer_name())
+
+    def _set_frame_override_error(self, error: bool) -> None:
+        """
+        Toggle the error highlight on the frame override field by flipping its dynamic
+        'error' property and re-polishing against the stylesheet from build time.
+        """
+        edit = self.frame_override_txt
+        if edit.property("error") == error:
+            return
+        edit.setProperty("error", error)
+        edit.style().unpolish(edit)
+        edit.style().polish(edit)
+
+    def closeEvent(self, event):  # pylint: disable=invalid-name
+        """
+        Disconnect the app-wide and Max-side listeners when the widget closes.
+        Without this, every reopened submitter leaves another instance processing
+        each focus transition and renderer change in the whole application.
+        """
+        try:
+            QApplication.instance().focusChanged.disconnect(self.on_focus_changed)
+        except RuntimeError:
+            # Already disconnected
+            pass
+        rt.callbacks.removeScripts(id=rt.Name("DeadlineCloudRendererChange"))
+        rt.callbacks.removeScripts(id=rt.Name("DeadlineCloudCameraCache"))
+        super().closeEvent(event)
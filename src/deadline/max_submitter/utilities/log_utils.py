@@ -4,9 +4,11 @@
 3ds Max Deadline Cloud Submitter - Global logger for 3ds Max Submitter
 """
 
+import atexit
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import os
+import queue
 
 LOGGING_FORMAT_FILE = (
     "%(asctime)s %(levelname)8s {%(threadName)-10s}:  %(module)s %(funcName)s: %(message)s"
@@ -18,6 +20,9 @@ LOG_DIRECTORY = "~/.deadline/logs/submitters/"
 LOG_NAME = "3dsmax.log"
 DATE_FORMAT = "%y%m%dZ%H%M%S"
 
+# Module-level reference keeps the background listener alive for the session
+_log_listener = None
+
 
 def configure_logging():
     """
@@ -32,17 +37,23 @@ def configure_logging():
     cout = logging.StreamHandler()
 
     dir_ = os.path.expanduser(LOG_DIRECTORY)
-    file = dir_ + LOG_NAME
-    # create path and/or dir if it doesn't exist yet
-    if not os.path.exists(file):
-        if not os.path.exists(dir_):
-            os.makedirs(dir_)
-        open(file, "w+")
-    fh = RotatingFileHandler(file, maxBytes=10485760, backupCount=5)
+    # Create the log dir if it doesn't exist yet; the handler creates the file itself,
+    # and delay=True defers the open until the first record so startup pays no file I/O
+    os.makedirs(dir_, exist_ok=True)
+    fh = RotatingFileHandler(dir_ + LOG_NAME, maxBytes=10485760, backupCount=5, delay=True)
 
     formatter = logging.Formatter(fmt=LOGGING_FORMAT_COUT, datefmt=DATE_FORMAT)
     formatter_file = logging.Formatter(fmt=LOGGING_FORMAT_FILE)
     cout.setFormatter(formatter)
     fh.setFormatter(formatter_file)
+
+    # Run the file handler behind a queue so UI-thread log calls only enqueue the
+    # record; the disk writes and rollover renames happen on the listener thread
+    global _log_listener
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    _log_listener = QueueListener(log_queue, fh, respect_handler_level=True)
+    _log_listener.start()
+    atexit.register(_log_listener.stop)
+
     logger.addHandler(cout)
-    logger.addHandler(fh)
+    logger.addHandler(QueueHandler(log_queue))
@@ -5,14 +5,59 @@
 """
 
 from pathlib import Path
+import functools
 import logging
 import os
+import re
 
 import pymxs  # separate import to initialize
 from pymxs import runtime as rt
 
 _logger = logging.getLogger(__name__)
 
+# Matches one 'start-end' pair; compiled once at import so frame range validation
+# doesn't re-tokenize the string by hand on every call
+_RANGE_RE = re.compile(r"(-?\d+)\s*-\s*(-?\d+)")
+
+# Renderers that can't be picked in the submitter
+# A360 Cloud rendering is only selectable in Target, not in Renderer itself
+_EXCLUDED_RENDERERS = frozenset({"A360_Cloud_Rendering", "Missing_Renderer"})
+
+_ATS_CALLBACK_ID = "DeadlineCloudATSDirty"
+_ats_callbacks_registered = False
+_ats_dirty = True
+
+
+def mark_ats_dirty() -> None:
+    """
+    Flags the Asset Tracking data as stale so the next consumer runs a full refresh.
+    Called after anything that changes scene references (merges, path resolution,
+    scene restores) and at the start of each submission.
+    """
+    global _ats_dirty
+    _ats_dirty = True
+
+
+def refresh_ats_if_dirty() -> None:
+    """
+    Runs ATSOps.Refresh only when the tracked state may have changed since the last
+    refresh. The refresh rescans the whole scene, so back-to-back consumers within
+    one submission shouldn't each pay for it. Scene switches re-arm the flag through
+    the Max callbacks registered on first use.
+    """
+    global _ats_dirty, _ats_callbacks_registered
+    if not _ats_callbacks_registered:
+        for event in ("filePostOpen", "systemPostNew", "systemPostReset"):
+            rt.callbacks.addScript(
+                rt.Name(event),
+                'python.execute "from utilities import max_utils; max_utils.mark_ats_dirty()"',
+                id=rt.Name(_ATS_CALLBACK_ID),
+            )
+        _ats_callbacks_registered = True
+    if _ats_dirty:
+        rt.ATSOps.Refresh()
+        _ats_dirty = False
+
 
 def get_referenced_files() -> list:
     """
@@ -22,31 +67,46 @@ def get_referenced_files() -> list:
     :return_type: list
     """
     # Refresh Asset Tracking to make sure we have the latest version
-    rt.ATSOps.Refresh()
+    refresh_ats_if_dirty()
 
     # Convert result from usedMaps MAXScript function into a python list
     maps = rt.ATSOps.GetFiles(pymxs.byref(None))
     # Note: ATSOps returns list[int, [file paths]]
     maps_in_scene = [str(x.replace("\\", "/")) for x in list(maps)[1]]
 
-    # Check for nested files to make sure the path correctly gets converted when it's relative
-    nested_files: list[list] = []
+    # Check for nested files to make sure the path correctly gets converted when it's relative.
+    # The per-map dependency queries stay (the flat recursive ATSOps call loses the
+    # parent/child pairing needed for the relative-path fix-up below), but the scene
+    # path is read once instead of per map and the O(N) list.index scans become one
+    # dict probe per nested file
+    scene_path = get_scene_path()
+    map_index = {path: i for i, path in enumerate(maps_in_scene)}
+    # Each rt.<attr> access resolves through pymxs; bind the loop-hot ones once
+    get_dependent_files = rt.ATSOps.GetDependentFiles
+    byref = pymxs.byref
+    # Three parallel arrays instead of one list-of-lists: no small list allocated
+    # per nested file, and the fix-up loop below indexes plain ints
+    nested_paths: list[str] = []
+    nested_indices: list[int] = []
+    parent_indices: list[int] = []
     for i, map_ in enumerate(maps_in_scene):
-        if os.path.normpath(map_) == get_scene_path():
+        if os.path.normpath(map_) == scene_path:
             continue
-        nested = rt.ATSOps.GetDependentFiles(map_, False, pymxs.byref(None))[1]
+        nested = get_dependent_files(map_, False, byref(None))[1]
         if not nested:
             continue
         for item in nested:
-            index = maps_in_scene.index(item.replace("\\", "/"))
             # Pass along the nested file, the index of that nested file and the index of the parent
             # in maps_in_scene
-            nested_files += [[item, index, i]]
+            nested_paths.append(item)
+            nested_indices.append(map_index[item.replace("\\", "/")])
+            parent_indices.append(i)
 
-    # Update the path in the maps_in_scene
-    for file in nested_files:
-        relative_dir = os.path.split(maps_in_scene[file[2]])[0]
-        maps_in_scene[file[1]] = os.path.join(relative_dir, file[0])
+    # Update the path in the maps_in_scene. The parent dir is read from the live list
+    # on purpose: with nested chains an earlier fix-up can rewrite the parent entry
+    for path, index, parent in zip(nested_paths, nested_indices, parent_indices):
+        relative_dir = os.path.split(maps_in_scene[parent])[0]
+        maps_in_scene[index] = os.path.join(relative_dir, path)
 
     return maps_in_scene
 
@@ -58,19 +118,24 @@ def get_renderers() -> list:
     :returns: list containing all usable renderers from 3ds Max
     :return_type: list
     """
-    # Convert result from rendererClass.classes MAXScript into a python list
-    renderers = [str(x) for x in list(rt.rendererClass.classes)]
-    # Remove unusable renderers from list
-    # A360 Cloud rendering is only selectable in Target, not in Renderer itself
-    try:
-        renderers.remove("A360_Cloud_Rendering")
-    except ValueError:
-        pass
-    try:
-        renderers.remove("Missing_Renderer")
-    except ValueError:
-        pass
-    return renderers
+    # Convert result from rendererClass.classes MAXScript into a python list,
+    # dropping the unusable renderers in the same pass
+    return [
+        renderer
+        for renderer in (str(x) for x in rt.rendererClass.classes)
+        if renderer not in _EXCLUDED_RENDERERS
+    ]
+
+
+def _scene_file_parts() -> tuple:
+    """
+    Reads maxFilePath and maxFileName in a single bridge crossing instead of one
+    attribute read each.
+
+    :returns: a (directory, filename) tuple for the current scene
+    """
+    parts = list(rt.execute("#(maxFilePath, maxFileName)"))
+    return str(parts[0]), str(parts[1])
 
 
 def get_scene_path() -> str:
@@ -81,7 +146,8 @@ def get_scene_path() -> str:
     :returns: current scene path
     :return_type: str
     """
-    return (rt.maxFilePath + rt.maxFileName).replace("\\", "/")
+    max_dir, max_name = _scene_file_parts()
+    return (max_dir + max_name).replace("\\", "/")
 
 
 def get_scene_name() -> str:
@@ -116,21 +182,24 @@ def get_frames() -> str:
                 - a frame range: e.g. '1-10'
                 - multiple frames and/or ranges in one string: e.g. '1,3,5-12'
     """
-    if rt.rendTimeType == 1:  # Single frame
+    # One pymxs read instead of one per comparison
+    rend_time_type = rt.rendTimeType
+    if rend_time_type == 1:  # Single frame
         current_frame = int(rt.sliderTime)
         return str(current_frame)
-    if rt.rendTimeType == 2:  # Active time segment
-        start_frame = int(rt.animationrange.start)
-        end_frame = int(rt.animationrange.end)
+    if rend_time_type == 2:  # Active time segment
+        animation_range = rt.animationrange
+        start_frame = int(animation_range.start)
+        end_frame = int(animation_range.end)
         return f"{start_frame}-{end_frame}"
-    if rt.rendTimeType == 3:  # User chosen range
+    if rend_time_type == 3:  # User chosen range
         start_frame = int(rt.rendStart)
         end_frame = int(rt.rendEnd)
         return f"{start_frame}-{end_frame}"
-    if rt.rendTimeType == 4:  # Pick up frames
+    if rend_time_type == 4:  # Pick up frames
         return rt.rendPickupFrames
 
-    raise ValueError(f"Unknown render time type: {rt.rendTimeType}")
+    raise ValueError(f"Unknown render time type: {rend_time_type}")
 
 
 def is_correct_frame_range(frames: str) -> bool:
@@ -143,15 +212,9 @@ def is_correct_frame_range(frames: str) -> bool:
     :returns: boolean that indicates whether the frame range was valid
     :return_type: bool
     """
-    frames_input = frames.strip()
-    override_frames = frames_input.split(",")
-    # only need to check for ranges, not single frames
-    frame_ranges = [pair for pair in override_frames if "-" in pair]
-    for range_ in frame_ranges:
-        numbers = range_.split("-")
-        if int(numbers[1]) <= int(numbers[0]):
-            return False
-    return True
+    # only ranges need checking, not single frames; the compiled pattern pulls out
+    # every start-end pair in one pass over the string
+    return all(int(start) < int(end) for start, end in _RANGE_RE.findall(frames))
 
 
 def get_duplicate_frames(frames: str) -> str:
@@ -166,35 +229,43 @@ def get_duplicate_frames(frames: str) -> str:
     """
     # remove any spaces and split into groups
     frames_input = frames.strip()
-    override_frames = frames_input.split(",")
-    frames_to_render: list[int] = []
+    frames_to_render: set[int] = set()
+    seen = frames_to_render.add
     duplicates: list[str] = []
-    for frames in override_frames:
-        try:
-            if frames_to_render:
-                if int(frames) in frames_to_render:
-                    duplicates.append(frames)
-            frames_to_render.append(int(frames))
-        # when there is a dash in the frame string it can't be converted to an int
-        # this way we can easily split single frames from ranges
-        except ValueError:
-            numbers = frames.split("-")
-            for i in range(int(numbers[0]), int(numbers[1]) + 1):
-                if frames_to_render:
-                    if i in frames_to_render:
-                        duplicates.append(str(i))
-                frames_to_render.append(i)
+    for token in frames_input.split(","):
+        # a dash splits single frames from ranges; partition avoids the
+        # try/except int() round trip per token
+        start, dash, end = token.partition("-")
+        if not dash:
+            frame = int(token)
+            if frame in frames_to_render:
+                duplicates.append(token)
+            seen(frame)
+        else:
+            for i in range(int(start), int(end) + 1):
+                if i in frames_to_render:
+                    duplicates.append(str(i))
+                seen(i)
     return ", ".join(duplicates)
 
 
+def _non_target_cameras() -> list:
+    """
+    Walks rt.cameras once and filters out the target objects, so the camera getters
+    below share a single traversal instead of each re-walking the scene.
+
+    :returns: a list with camera nodes
+    """
+    return [camera for camera in rt.cameras if "$Target:" not in str(camera)]
+
+
 def get_camera_names() -> list:
     """
     Gets all cameras present in the max scene and removes the target objects from the list.
 
     :returns: a list with cameras
     """
-    cameras = [camera.name for camera in rt.cameras if "$Target:" not in str(camera)]
-    return cameras
+    return [camera.name for camera in _non_target_cameras()]
 
 
 def get_stereo_cameras() -> list:
@@ -204,18 +275,23 @@ def get_stereo_cameras() -> list:
 
     :returns: a list with stereo cameras and their relative position to their parent
     """
-    all_cameras = [
-        [camera.name, camera.parent, camera]
-        for camera in rt.cameras
-        if "$Target:" not in str(camera)
+    # Stereo camera plugin creates a parent of type StereoCameraAssemblyHead; when the
+    # plugin isn't loaded but used, Max swaps that object for a Helper_Stand_in.
+    # Resolving the classes up front and comparing with classOf beats building a
+    # display string per parent just to substring-match the class name out of it;
+    # either class evaluates to undefined when it isn't registered
+    parent_classes = [
+        max_class
+        for max_class in (rt.execute("StereoCameraAssemblyHead"), rt.execute("Helper_Stand_in"))
+        if max_class is not None
     ]
+    class_of = rt.classOf
     stereo_cameras = []
-    for camera in all_cameras:
-        # Stereo camera plugin creates object of type StereoCameraAssemblyHead
-        # When the plugin isn't loaded but used it changes that object to Helper_Stand_in
-        if "StereoCameraAssemblyHead" in str(camera[1]) or "$Helper_Stand_in:" in str(camera[1]):
-            relative_pos = list((camera[2].transform * rt.inverse(camera[1].transform)).position)
-            stereo_cameras.append([camera[0], relative_pos])
+    for camera in _non_target_cameras():
+        parent = camera.parent
+        if parent is not None and class_of(parent) in parent_classes:
+            relative_pos = list((camera.transform * rt.inverse(parent.transform)).position)
+            stereo_cameras.append([camera.name, relative_pos])
     return stereo_cameras
 
 
@@ -225,18 +301,28 @@ def get_stereo_camera_names() -> list:
 
     :returns: a list with stereo cameras
     """
-    all_cameras = [
-        [camera.name, camera.parent, camera]
-        for camera in rt.cameras
-        if "$Target:" not in str(camera)
-    ]
-    stereo_cameras = []
-    for camera in all_cameras:
-        # Stereo camera plugin creates object of type StereoCameraAssemblyHead
-        # When the plugin isn't loaded but used it changes that object to Helper_Stand_in
-        if "StereoCameraAssemblyHead" in str(camera[1]) or "$Helper_Stand_in:" in str(camera[1]):
-            stereo_cameras.append(camera[0])
-    return stereo_cameras
+    return [camera[0] for camera in get_stereo_cameras()]
+
+
+def partition_stereo_camera_names() -> tuple:
+    """
+    Splits the stereo cameras into left, right and center in one pass over a single
+    scene walk. Cameras get isolated based on their relative position.
+
+    :returns: a (left, right, center) tuple of stereo camera name lists
+    """
+    left: list = []
+    right: list = []
+    center: list = []
+    for name, relative_pos in get_stereo_cameras():
+        x_offset = relative_pos[0]
+        if x_offset < 0:
+            left.append(name)
+        elif x_offset > 0:
+            right.append(name)
+        else:
+            center.append(name)
+    return left, right, center
 
 
 def get_left_stereo_camera_names() -> list:
@@ -245,9 +331,7 @@ def get_left_stereo_camera_names() -> list:
 
     :returns: a list with left stereo cameras
     """
-    all_stereo_cameras = get_stereo_cameras()
-    left_cams = [cam[0] for cam in all_stereo_cameras if cam[1][0] < 0]
-    return left_cams
+    return partition_stereo_camera_names()[0]
 
 
 def get_right_stereo_camera_names() -> list:
@@ -256,9 +340,7 @@ def get_right_stereo_camera_names() -> list:
 
     :returns: a list with right stereo cameras
     """
-    all_stereo_cameras = get_stereo_cameras()
-    right_cams = [cam[0] for cam in all_stereo_cameras if cam[1][0] > 0]
-    return right_cams
+    return partition_stereo_camera_names()[1]
 
 
 def get_center_stereo_camera_names() -> list:
@@ -267,9 +349,48 @@ def get_center_stereo_camera_names() -> list:
 
     :returns: a list with center stereo cameras
     """
-    all_stereo_cameras = get_stereo_cameras()
-    center_cams = [cam[0] for cam in all_stereo_cameras if cam[1][0] == 0]
-    return center_cams
+    return partition_stereo_camera_names()[2]
+
+
+_STEREO_PLUGIN_CALLBACK_ID = "DeadlineCloudStereoPlugin"
+_stereo_plugin_callbacks_registered = False
+
+
+@functools.lru_cache(maxsize=1)
+def _get_system_classes() -> frozenset:
+    """
+    Stringifies rt.system.classes once per session. The registered class list is
+    driven by which plugins are loaded, not by the scene, so unlike the plugin state
+    probe below this cache survives scene switches.
+
+    :returns: a frozenset with the names of all registered system classes
+    """
+    return frozenset(str(class_) for class_ in rt.system.classes)
+
+
+@functools.lru_cache(maxsize=1)
+def _stereo_plugin_state() -> tuple:
+    """
+    Probes the plugin registry once and returns (used but not loaded, used and loaded)
+    for the stereo camera plugin. The result is memoized per scene: the plugin state
+    can't change within a scene, and the Max callbacks registered on first use clear
+    the cache when another scene is opened.
+    """
+    global _stereo_plugin_callbacks_registered
+    if not _stereo_plugin_callbacks_registered:
+        for event in ("filePostOpen", "systemPostNew", "systemPostReset"):
+            rt.callbacks.addScript(
+                rt.Name(event),
+                'python.execute "from utilities import max_utils; '
+                'max_utils._stereo_plugin_state.cache_clear()"',
+                id=rt.Name(_STEREO_PLUGIN_CALLBACK_ID),
+            )
+        _stereo_plugin_callbacks_registered = True
+    used_plugins = rt.fileProperties.getItems("Used Plug-Ins")
+    if not used_plugins or "stereocamera.dlo" not in used_plugins:
+        return False, False
+    system_classes = _get_system_classes()
+    return "StereoCamera" not in system_classes, "StereoCameraRig" in system_classes
 
 
 def stereo_plugin_used_but_not_loaded() -> bool:
@@ -279,11 +400,7 @@ def stereo_plugin_used_but_not_loaded() -> bool:
 
     :returns: a boolean indicating if the plugin is used but not installed
     """
-    if rt.fileProperties.getItems("Used Plug-Ins"):
-        used_plugins = [plugin for plugin in rt.fileProperties.getItems("Used Plug-Ins")]
-        system_classes = [str(class_) for class_ in rt.system.classes]
-        return "stereocamera.dlo" in used_plugins and "StereoCamera" not in system_classes
-    return False
+    return _stereo_plugin_state()[0]
 
 
 def stereo_plugin_used_and_loaded() -> bool:
@@ -293,24 +410,111 @@ def stereo_plugin_used_and_loaded() -> bool:
 
     :returns: a boolean indicating if the plugin is used and installed
     """
-    if rt.fileProperties.getItems("Used Plug-Ins"):
-        used_plugins = [plugin for plugin in rt.fileProperties.getItems("Used Plug-Ins")]
-        system_classes = [str(class_) for class_ in rt.system.classes]
-        return "stereocamera.dlo" in used_plugins and "StereoCameraRig" in system_classes
-    return False
+    return _stereo_plugin_state()[1]
+
+
+_renderer_name_fn_registered = False
+
+
+def get_current_renderer_name() -> str:
+    """
+    Gets the name of the renderer the scene is currently set to.
+
+    :returns: the renderer name, e.g. 'ART_Renderer'
+    """
+    # Asking MAXScript for the class name directly returns just the part we want in a
+    # single bridge crossing, instead of stringifying the renderer instance (which
+    # looks like 'ART_Renderer:ART_Renderer') and splitting it in Python
+    global _renderer_name_fn_registered
+    if not _renderer_name_fn_registered:
+        rt.execute("fn _dcCurrentRendererName = ((classOf renderers.current) as string)")
+        _renderer_name_fn_registered = True
+    return str(rt._dcCurrentRendererName())
+
+
+_state_set_fn_registered = False
+
+
+def set_active_state_set(index: int) -> None:
+    """
+    Makes the state set at the given index the current state set of the scene.
+
+    The dotNet plumbing is registered once as a MAXScript function; every switch after
+    that sends a short call across the pymxs bridge instead of having 3ds Max re-parse
+    the full script.
+
+    :param index: the index of the state set to activate
+    """
+    global _state_set_fn_registered
+    if not _state_set_fn_registered:
+        rt.execute(
+            "fn _dcSetStateSet i = (\n"
+            '    local stateSets = (dotNetObject "Autodesk.Max.StateSets.Plugin").Instance\n'
+            "    local masterState = stateSets.EntityManager.RootEntity.MasterStateSet\n"
+            "    masterState.CurrentState = #(masterState.Children.Item[i])\n"
+            ")"
+        )
+        _state_set_fn_registered = True
+    rt._dcSetStateSet(index)
+
+
+_state_set_snapshot_fn_registered = False
+
+
+def get_state_set_render_outputs() -> list:
+    """
+    Walks all state sets in a single MAXScript call, activating each one and collecting
+    its name, index and render output path.
+
+    Running the whole walk inside 3ds Max costs one pymxs round trip instead of a
+    switch call plus attribute reads per state set. The last state set is left active,
+    the same as switching through them one by one.
+
+    :returns: a list of [name, index, render output filename] triples, with the index
+        matching the ones returned by get_state_set_names
+    """
+    global _state_set_snapshot_fn_registered
+    if not _state_set_snapshot_fn_registered:
+        rt.execute(
+            "fn _dcStateSetSnapshots = (\n"
+            '    local stateSets = (dotNetObject "Autodesk.Max.StateSets.Plugin").Instance\n'
+            "    local masterState = stateSets.EntityManager.RootEntity.MasterStateSet\n"
+            "    local snapshots = #()\n"
+            "    for i = 0 to masterState.Children.count - 2 do (\n"
+            "        local child = masterState.Children.Item[i]\n"
+            "        masterState.CurrentState = #(child)\n"
+            "        local renderOutput = rendOutputFilename\n"
+            '        if renderOutput == undefined do renderOutput = ""\n'
+            "        append snapshots #(child.Name, i, renderOutput)\n"
+            "    )\n"
+            "    snapshots\n"
+            ")"
+        )
+        _state_set_snapshot_fn_registered = True
+    return [[str(item[0]), int(item[1]), str(item[2])] for item in rt._dcStateSetSnapshots()]
+
+
+_state_set_names_fn_registered = False
 
 
 def get_state_set_names() -> list:
     """
     Gets all state sets present in the max scene.
 
+    The walk runs inside one MAXScript call, instead of a dotNet attribute read per
+    state set across the pymxs bridge.
+
     :returns: a list with state set names and their index
     """
-    state_sets_dot_net_object = rt.dotNetObject("Autodesk.Max.StateSets.Plugin")
-    state_sets_instance = state_sets_dot_net_object.Instance
-    master_state = state_sets_instance.EntityManager.RootEntity.MasterStateSet
-
-    state_sets = []
-    for i in range(-1, master_state.Children.count - 2):
-        state_sets.append([master_state.Children.Item[i].Name, i + 1])
-    return state_sets
+    global _state_set_names_fn_registered
+    if not _state_set_names_fn_registered:
+        rt.execute(
+            "fn _dcStateSetNames = (\n"
+            '    local stateSets = (dotNetObject "Autodesk.Max.StateSets.Plugin").Instance\n'
+            "    local masterState = stateSets.EntityManager.RootEntity.MasterStateSet\n"
+            "    for i = 0 to masterState.Children.count - 2 collect\n"
+            "        #(masterState.Children.Item[i].Name, i)\n"
+            ")"
+        )
+        _state_set_names_fn_registered = True
+    return [[str(item[0]), int(item[1])] for item in rt._dcStateSetNames()]
@@ -6,6 +6,8 @@
 
 import logging
 import os
+import shutil
+from typing import Optional
 
 import pymxs  # separate import to initialize
 from pymxs import runtime as rt
@@ -49,10 +51,15 @@ def save_max_backup_file(dest: str, use_max_hold: bool = False):
         hold_temp_filename = hold_dir + "maxhold.tmp"
         hold_exists = os.path.exists(hold_filename)
 
-        # Delete the old temp hold and create a copy of the current hold
+        # Delete the old temp hold and create a copy of the current hold.
+        # The shuffling below uses os/shutil directly: the rt file functions route
+        # every call through the MAXScript bridge for what is plain filesystem work
         if hold_exists:
-            rt.deleteFile(hold_temp_filename)
-            rt.renameFile(hold_filename, hold_temp_filename)
+            try:
+                os.remove(hold_temp_filename)
+            except FileNotFoundError:
+                pass
+            os.replace(hold_filename, hold_temp_filename)
 
         # Save the Max scene to the hold
         rt.holdMaxFile()
@@ -61,18 +68,23 @@ def save_max_backup_file(dest: str, use_max_hold: bool = False):
             _logger.error(f"Saving the file as '{hold_filename}' via hold() did not work")
             return f"Saving the file as '{hold_filename}' via hold() did not work"
 
-        # Remove old file before copying over
-        if os.path.exists(dest):
-            rt.deleteFile(dest)
-
-        if not rt.renameFile(hold_filename, dest):
-            if not rt.copyFile(hold_filename, dest):
+        # os.replace overwrites an existing destination in place; copy as a fallback
+        # when the destination is on another volume
+        try:
+            os.replace(hold_filename, dest)
+        except OSError:
+            try:
+                shutil.copy2(hold_filename, dest)
+            except OSError:
                 _logger.error(f"Could not copy the saved scene file to '{dest}'")
                 return f"Could not copy the saved scene file to '{dest}'"
 
         if hold_exists:
-            rt.deleteFile(hold_filename)
-            rt.renameFile(hold_temp_filename, hold_filename)
+            try:
+                os.remove(hold_filename)
+            except FileNotFoundError:
+                pass
+            os.replace(hold_temp_filename, hold_filename)
     else:
         rt.saveMaxFile(dest, clearNeedSaveFlag=False, useNewFile=False, quiet=True)
         if not os.path.exists(dest):
@@ -98,20 +110,33 @@ def restore_max_copy(src: str):
     hold_temp_filename = hold_dir + "maxhold.tmp"
     hold_exists = os.path.exists(hold_filename)
 
+    # Same as save_max_backup_file: plain filesystem shuffling goes through os/shutil
+    # instead of paying a MAXScript bridge crossing per file operation
     if hold_exists:
-        rt.deleteFile(hold_temp_filename)
-        rt.renameFile(hold_filename, hold_temp_filename)
-
-    rt.copyFile(src, hold_filename)
+        try:
+            os.remove(hold_temp_filename)
+        except FileNotFoundError:
+            pass
+        os.replace(hold_filename, hold_temp_filename)
+
+    try:
+        shutil.copy2(src, hold_filename)
+    except OSError:
+        pass
     if not os.path.exists(hold_filename):
         _logger.error("Restoring the file via fetch() did not work")
         return "Restoring the file via fetch() did not work"
 
     rt.fetchMaxFile(quiet=True)
+    # The fetch swapped the whole scene out from under the tracked state
+    max_utils.mark_ats_dirty()
 
     if hold_exists:
-        rt.deleteFile(hold_filename)
-        rt.renameFile(hold_temp_filename, hold_filename)
+        try:
+            os.remove(hold_filename)
+        except FileNotFoundError:
+            pass
+        os.replace(hold_temp_filename, hold_filename)
 
     _logger.debug("Restored the file successfully")
     return "undefined"
@@ -144,6 +169,37 @@ def merge_xrefs(settings: RenderSubmitterUISettings, assets: AssetReferences):
     return assets
 
 
+def _build_exists_map(paths) -> dict:
+    """
+    Checks which of the given files exist with one directory listing per distinct
+    directory instead of a stat call per file. XRefs commonly share a handful of
+    directories (often on network storage, where each stat is a round trip).
+
+    :param paths: the filepaths to check
+    :returns: a dict mapping each path to whether it exists
+    """
+    listed_dirs: dict[str, Optional[set]] = {}
+    exists_map: dict[str, bool] = {}
+    for path in paths:
+        directory, filename = os.path.split(path)
+        if directory not in listed_dirs:
+            try:
+                listed_dirs[directory] = {
+                    os.path.normcase(entry) for entry in os.listdir(directory)
+                }
+            except OSError:
+                # Traverse-only/non-listable directories happen on network storage;
+                # a missing verdict here would get the XRef deleted from the scene,
+                # so fall back to per-file stats rather than assume absence
+                listed_dirs[directory] = None
+        entries = listed_dirs[directory]
+        if entries is None:
+            exists_map[path] = os.path.exists(path)
+        else:
+            exists_map[path] = os.path.normcase(filename) in entries
+    return exists_map
+
+
 def merge_xref_scenes(assets: AssetReferences):
     """
     Merges the scene XRefs. Disabled and missing XRefs get removed from the file.
@@ -155,29 +211,45 @@ def merge_xref_scenes(assets: AssetReferences):
     done_merging = False
     iterations = 1
     input_files = assets.input_filenames
+    # Each rt.<attr> access resolves through pymxs; bind the loop-hot ones once
+    merge_xref = rt.merge
+    delete_xref = rt.delete
+    # Batch the per-XRef progress lines into one info() per iteration; the
+    # isEnabledFor check also skips the f-string formatting when INFO is off
+    info_enabled = _logger.isEnabledFor(logging.INFO)
     while not done_merging:
         failed_files = []
-        current_xrefs_count = rt.xrefs.getXRefFileCount()
-        for i in range(current_xrefs_count, 0, -1):
-            xref_file = rt.xrefs.getXRefFile(i)
-            xref_filepath = xref_file.filename
+        progress_lines: list[str] = []
+        # Snapshot the XRef records in one MAXScript crossing instead of a count
+        # read plus a getXRefFile and filename read per index
+        records = rt.execute(
+            "for i = xrefs.getXRefFileCount() to 1 by -1 collect "
+            "#(i, (xrefs.getXRefFile i), (xrefs.getXRefFile i).filename)"
+        )
+        records = [(record[0], record[1], str(record[2])) for record in map(list, records)]
+        exists_map = _build_exists_map(path for _, _, path in records)
+        for i, xref_file, xref_filepath in records:
             # Check that file exists
-            if os.path.exists(xref_filepath):
+            if exists_map[xref_filepath]:
                 # Check if the XRef is enabled
                 # If it is, merge
                 if not xref_file.disabled:
-                    result = rt.merge(xref_file)
+                    result = merge_xref(xref_file)
                     if result:
                         input_files.discard(xref_filepath)
-                        _logger.info(f"Merged Scene XRef File {i} [{xref_filepath}]")
+                        if info_enabled:
+                            progress_lines.append(f"Merged Scene XRef File {i} [{xref_filepath}]")
                     else:
                         _logger.warning(f"Failed to merge Scene XRef {i} [{xref_filepath}]")
                         failed_files.append(xref_filepath)
                 # If it is not, delete the XRef to avoid surprises at render time
                 else:
-                    result = rt.delete(xref_file)
+                    result = delete_xref(xref_file)
                     if result:
-                        _logger.info(f"Deleted Disabled Scene XRef File {i} [{xref_filepath}]")
+                        if info_enabled:
+                            progress_lines.append(
+                                f"Deleted Disabled Scene XRef File {i} [{xref_filepath}]"
+                            )
                     else:  # should never happen
                         _logger.warning(
                             f"Failed to delete disabled Scene XRef {i} [{xref_filepath}]"
@@ -185,24 +257,29 @@ def merge_xref_scenes(assets: AssetReferences):
                         failed_files.append(xref_filepath)
             # When the file doesn't exist delete the XRef
             else:
-                result = rt.delete(xref_file)
+                result = delete_xref(xref_file)
                 if result:
-                    _logger.info(f"Deleted Missing Scene XRef File {i} [{xref_filepath}]")
+                    if info_enabled:
+                        progress_lines.append(
+                            f"Deleted Missing Scene XRef File {i} [{xref_filepath}]"
+                        )
                 else:  # should never happen
                     _logger.warning(f"Failed to delete missing Scene XRef {i} [{xref_filepath}]")
                     failed_files.append(xref_filepath)
-        files_to_merge = 0
-        current_xrefs_count = rt.xrefs.getXRefFileCount()
-        for i in range(1, current_xrefs_count):
-            xref_file = rt.xrefs.getXRefFile(i)
-            if xref_file.filename in failed_files:
-                files_to_merge += 1
+        # Every XRef either merged, got deleted or landed in failed_files this
+        # iteration, so the failed list already is the remaining work; no need to
+        # re-walk the XRefs through pymxs to count them
+        files_to_merge = len(failed_files)
         done_merging = files_to_merge == 0
-        _logger.info(
-            f"End of Scene XRef Merging iteration {iterations} - {files_to_merge} files left to merge"
-        )
+        if info_enabled:
+            progress_lines.append(
+                f"End of Scene XRef Merging iteration {iterations} - {files_to_merge} files left to merge"
+            )
+            _logger.info("\n".join(progress_lines))
         iterations += 1
     assets.input_filenames = input_files
+    # Merging changed the scene's references
+    max_utils.mark_ats_dirty()
     _logger.info("Done merging Scene XRefs")
     return assets
 
@@ -218,21 +295,35 @@ def merge_xref_objects(assets: AssetReferences):
     done_merging = False
     iterations = 1
     input_files = assets.input_filenames
+    # Each rt.<attr> access resolves through pymxs; bind the loop-hot ones once
+    obj_xref_mgr = rt.objXrefMgr
+    merge_record = obj_xref_mgr.MergeRecordIntoScene
+    remove_record = obj_xref_mgr.RemoveRecordFromScene
+    # Batch the per-XRef progress lines into one info() per iteration; the
+    # isEnabledFor check also skips the f-string formatting when INFO is off
+    info_enabled = _logger.isEnabledFor(logging.INFO)
     while not done_merging:
         failed_files = []
-        current_xrefs_count = rt.objXrefMgr.recordCount
-        for i in range(current_xrefs_count, 0, -1):
-            xref_record = rt.objXrefMgr.GetRecord(i)
-            xref_filepath = xref_record.srcFileName
+        progress_lines: list[str] = []
+        # Snapshot the XRef records in one MAXScript crossing instead of a count
+        # read plus a GetRecord and srcFileName read per index
+        records = rt.execute(
+            "for i = objXrefMgr.recordCount to 1 by -1 collect "
+            "#(i, (objXrefMgr.GetRecord i), (objXrefMgr.GetRecord i).srcFileName)"
+        )
+        records = [(record[0], record[1], str(record[2])) for record in map(list, records)]
+        exists_map = _build_exists_map(path for _, _, path in records)
+        for i, xref_record, xref_filepath in records:
             # Check that file exists
-            if os.path.exists(xref_filepath):
+            if exists_map[xref_filepath]:
                 # Check if the XRef is enabled
                 # If it is, merge
                 if xref_record.enabled:
-                    result = rt.objXrefMgr.MergeRecordIntoScene(xref_record)
+                    result = merge_record(xref_record)
                     if result:
                         input_files.discard(xref_filepath)
-                        _logger.info(f"Merged XRef Object {i} [{xref_filepath}]")
+                        if info_enabled:
+                            progress_lines.append(f"Merged XRef Object {i} [{xref_filepath}]")
                     else:
                         _logger.warning(f"Failed to merge XRef Object {i} [{xref_filepath}]")
                         failed_files.append(xref_filepath)
@@ -241,9 +332,12 @@ def merge_xref_objects(assets: AssetReferences):
                     # Note: XRef objects have to be enabled before
                     #       operations can be done on them
                     xref_record.enabled = True
-                    result = rt.objXrefMgr.RemoveRecordFromScene(xref_record)
+                    result = remove_record(xref_record)
                     if result:
-                        _logger.info(f"Deleted Disabled XRef Object {i} [{xref_filepath}]")
+                        if info_enabled:
+                            progress_lines.append(
+                                f"Deleted Disabled XRef Object {i} [{xref_filepath}]"
+                            )
                     else:  # should never happen
                         _logger.warning(
                             f"Failed to delete disabled XRef Object {i} [{xref_filepath}]"
@@ -254,24 +348,27 @@ def merge_xref_objects(assets: AssetReferences):
                 # note: XRef objects have to be enabled before
                 #       operations can be done on them
                 xref_record.enabled = True
-                result = rt.objXrefMgr.RemoveRecordFromScene(xref_record)
+                result = remove_record(xref_record)
                 if result:
-                    _logger.info(f"Deleted Missing XRef Objects {i} [{xref_filepath}]")
+                    if info_enabled:
+                        progress_lines.append(f"Deleted Missing XRef Objects {i} [{xref_filepath}]")
                 else:  # should never happen
                     _logger.warning(f"Failed to delete missing XRef Object {i} [{xref_filepath}]")
                     failed_files.append(xref_filepath)
-        files_to_merge = 0
-        current_xrefs_count = rt.objXrefMgr.recordCount
-        for i in range(1, current_xrefs_count):
-            xref_record = rt.objXrefMgr.GetRecord(i)
-            if xref_record.srcFileName in failed_files:
-                files_to_merge += 1
+        # Every record either merged, got deleted or landed in failed_files this
+        # iteration, so the failed list already is the remaining work; no need to
+        # re-walk the records through pymxs to count them
+        files_to_merge = len(failed_files)
         done_merging = files_to_merge == 0
-        _logger.info(
-            f"End of XRef Object Merging iteration {iterations} - {files_to_merge} files left to merge"
-        )
+        if info_enabled:
+            progress_lines.append(
+                f"End of XRef Object Merging iteration {iterations} - {files_to_merge} files left to merge"
+            )
+            _logger.info("\n".join(progress_lines))
         iterations += 1
     assets.input_filenames = input_files
+    # Merging changed the scene's references
+    max_utils.mark_ats_dirty()
     _logger.info("Done merging XRefs Objects")
     return assets
 
@@ -287,11 +384,17 @@ def clear_material_editor() -> list:
     if editor_open:
         rt.MatEditor.Close()
         _logger.info("Closed the Material Editor")
-    material_storage = []
-    # Note: meditMaterials is a system global containing 24 sample slots in the Material Editor
-    for i in range(0, 24):
-        material_storage.append(rt.meditMaterials[i])
-        rt.meditMaterials[i] = rt.standard()
+    # Note: meditMaterials is a system global containing 24 sample slots in the Material Editor.
+    # Save and clear all 24 slots in one MAXScript block instead of 48 per-slot crossings
+    material_storage = list(
+        rt.execute(
+            "(\n"
+            "    local savedMats = for i = 1 to 24 collect meditMaterials[i]\n"
+            "    for i = 1 to 24 do meditMaterials[i] = standard()\n"
+            "    savedMats\n"
+            ")"
+        )
+    )
     _logger.info("Cleared the Material Editor")
     return material_storage
 
@@ -303,9 +406,12 @@ def restore_material_editor(materials: list):
 
     :param materials: the previously saved materials we want to restore
     """
-    # Note: meditMaterials is a system global containing 24 sample slots in the Material Editor
-    for i in range(0, 24):
-        rt.meditMaterials[i] = materials[i]
+    # Note: meditMaterials is a system global containing 24 sample slots in the Material Editor.
+    # Hand the saved slots back to MAXScript and restore them in one block instead of
+    # 24 per-slot crossings
+    rt._dcSavedMeditMaterials = materials
+    rt.execute("for i = 1 to 24 do meditMaterials[i] = _dcSavedMeditMaterials[i]")
+    rt.execute("_dcSavedMeditMaterials = undefined")
     _logger.info("Restored the Material Editor")
 
 
@@ -331,6 +437,40 @@ def lock_material_editor_renderer():
         _logger.info("Locked the Material Editor Renderer")
 
 
+_scene_tweaks_fns_registered = False
+
+
+def _register_scene_tweaks_fns():
+    """
+    Compiles the scene tweaks material overrides as MAXScript functions once per
+    session, so apply_custom_material calls prebuilt functions instead of handing
+    script source to the MAXScript parser on every submission.
+    """
+    global _scene_tweaks_fns_registered
+    if _scene_tweaks_fns_registered:
+        return
+    # The captured materials stay in a MAXScript global: marshalling a per-object
+    # array of node wrappers into Python and back costs a crossing per element,
+    # and Python only ever needs a handle to the whole batch
+    rt.execute(
+        "fn _dcCollectSceneMats = ("
+        "_dcOldSceneMats = for o in objects collect #(o, o.material, o.colorByLayer); "
+        "_dcOldSceneMats.count)"
+    )
+    rt.execute(
+        "fn _dcRestoreSceneMats = ("
+        "for e in _dcOldSceneMats do (e[1].material = e[2]; e[1].colorByLayer = e[3]); "
+        "_dcOldSceneMats = undefined)"
+    )
+    rt.execute("fn _dcApplyStandardMat = (objects.material = standard())")
+    rt.execute("fn _dcApplyNoMat = (objects.material = undefined)")
+    rt.execute(
+        "fn _dcApplyWireColorMat = (objects.material = undefined; objects.colorByLayer = true)"
+    )
+    rt.execute("fn _dcApplyMeditMat = (objects.material = meditMaterials[1])")
+    _scene_tweaks_fns_registered = True
+
+
 def apply_custom_material(custom_mat_: str) -> str:
     """
     Applies a custom user-defined material to all geometry objects in the scene.
@@ -338,28 +478,28 @@ def apply_custom_material(custom_mat_: str) -> str:
 
     :param custom_mat_: a str representing the user-defined material from the ui
 
-    :returns: a MaxScript list of the original materials applied to the objects in format
-    #(#(object, material, colorByLayer bool)). Has to be a MaxScript list so that we can later restore them
-    correctly in python
+    :returns: the name of the MAXScript global holding the original materials in format
+    #(#(object, material, colorByLayer bool)). The array stays MAXScript-side so
+    restore_scene_materials can put everything back without per-object crossings
     """
-    old_materials = rt.execute(
-        "old_materials = for o in objects collect #(o, o.material, o.colorByLayer)"
-    )
+    _register_scene_tweaks_fns()
+    rt._dcCollectSceneMats()
+    old_materials = "_dcOldSceneMats"
     if custom_mat_ == SCENE_TWEAKS_MATS[0]:
-        rt.execute("objects.material = standard()")
+        rt._dcApplyStandardMat()
         mat_type = SCENE_TWEAKS_MATS[0]
-    if custom_mat_ == SCENE_TWEAKS_MATS[1]:
-        rt.execute("objects.material = undefined")
+    elif custom_mat_ == SCENE_TWEAKS_MATS[1]:
+        rt._dcApplyNoMat()
         mat_type = SCENE_TWEAKS_MATS[1]
-    if custom_mat_ == SCENE_TWEAKS_MATS[2]:
-        rt.execute("objects.material = undefined \n" "objects.colorByLayer = true")
+    elif custom_mat_ == SCENE_TWEAKS_MATS[2]:
+        rt._dcApplyWireColorMat()
         mat_type = SCENE_TWEAKS_MATS[2]
-    if custom_mat_ == SCENE_TWEAKS_MATS[3]:
+    elif custom_mat_ == SCENE_TWEAKS_MATS[3]:
         if rt.superClassOf(rt.meditmaterials[1]) == "material":
-            rt.execute("objects.material = meditmaterial[1]")
+            rt._dcApplyMeditMat()
             mat_type = SCENE_TWEAKS_MATS[3]
         else:
-            rt.execute("objects.material = standard()")
+            rt._dcApplyStandardMat()
             mat_type = "Standard Grayscale Material Instead Of Medit Slot 1"
     _logger.info(f"Assigned {mat_type} to Scene Objects")
     return old_materials
@@ -371,12 +511,13 @@ def restore_scene_materials(materials):
     custom user-defined material.
     Functionality and structure based on original 3ds Max Deadline Submitter.
 
-    :param materials: the previously stored materials we want to revert back to in format
-    [object, material, colorByLayer bool]
+    :param materials: the name of the MAXScript global the materials were captured
+    into by apply_custom_material
     """
-    for obj in materials:
-        obj[0].material = obj[1]
-        obj[0].colorByLayer = obj[2]
+    # The whole restore runs MAXScript-side: the old Python loop paid two attribute
+    # writes per object across the bridge
+    _register_scene_tweaks_fns()
+    rt._dcRestoreSceneMats()
     _logger.info("Restored the materials of the Scene Objects")
 
 
@@ -410,22 +551,29 @@ def make_paths_absolute():
     scene = max_utils.get_scene_path()
 
     # Refresh Asset Tracking panel to make sure it uses the correct references
-    rt.ATSOps.Refresh()
+    max_utils.refresh_ats_if_dirty()
     linked_files = rt.ATSOps.GetDependentFiles(scene, True, pymxs.byref(None))[1]
+    # The per-file dependency queries stay (the recursive root call above loses the
+    # parent/child pairing the fix-up needs), but the rebuilt already_nested list and
+    # its linear scans per item become one dict probe
     nested_files: list[list[str]] = []
+    nested_index: dict[str, int] = {}
+    # Each rt.<attr> access resolves through pymxs; bind the loop-hot ones once
+    get_dependent_files = rt.ATSOps.GetDependentFiles
+    byref = pymxs.byref
     for file in linked_files:
-        nested_file = rt.ATSOps.GetDependentFiles(file, False, pymxs.byref(None))[1]
+        nested_file = get_dependent_files(file, False, byref(None))[1]
         for item in nested_file:
             # Only add to list if path is relative
             if item and not os.path.isabs(item) and os.path.splitext(item)[1] == ".max":
                 # If the parent file of the current item is a nested file, join the path with its parent to get the
                 # correct parent directory
-                already_nested = [x[0] for x in nested_files]
-                if file in already_nested:
-                    index = already_nested.index(file)
+                index = nested_index.get(file)
+                if index is not None:
                     relative_dir = os.path.split(nested_files[index][1])[0]
                     file = os.path.join(relative_dir, nested_files[index][0])
                 nested_files += [[item, file]]
+                nested_index.setdefault(item, len(nested_files) - 1)
 
     # If there are deep references, remove from selection and create new xref
     if nested_files:
@@ -452,3 +600,6 @@ def make_paths_absolute():
     rt.DialogMonitorOps.unRegisterNotification(id=rt.name("fileMan_closeErrorDialog"))
     rt.DialogMonitorOps.enabled = False
     rt.DialogMonitorOps.interactive = True
+
+    # The resolution above rewrote reference paths
+    max_utils.mark_ats_dirty()
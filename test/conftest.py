@@ -0,0 +1,19 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import pytest
+
+
+def pytest_collection_modifyitems(items: list[pytest.Item]) -> None:
+    """
+    Group tests by module for pytest-xdist's loadgroup scheduler, so tests that
+    share module-level state (mocked pymxs, MaxAdaptor class attributes patched
+    by the adaptor tests) stay on the same worker while different modules still
+    run in parallel.
+    """
+    for item in items:
+        # Not every Item subclass carries a module (e.g. doctest items)
+        module = getattr(item, "module", None)
+        if module is not None:
+            item.add_marker(pytest.mark.xdist_group(module.__name__))
@@ -0,0 +1,112 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+from __future__ import annotations
+
+import types
+from contextlib import ExitStack
+from typing import Generator
+from unittest.mock import PropertyMock, patch
+
+import pytest
+
+from deadline.max_adaptor.MaxAdaptor import MaxAdaptor
+
+# One frozen data template per session; the fixtures below hand out cheap copies
+_INIT_DATA = types.MappingProxyType(
+    {
+        # "animation": True,
+        "renderer": "Default_Scanline_Renderer",
+        "state_set": "State01",
+        "strict_error_checking": True,
+        # "version": 2022,
+        "output_file_path": "C:/workspace/deadline-cloud-for-3ds-max/test_projects/adaptor/output",
+        "scene_file": "C:/workspace/deadline-cloud-for-3ds-max/test_projects/adaptor/teapot_blank.max",
+        "camera": "Camera001",
+        "output_file_name": "output_###",
+    }
+)
+_RUN_DATA = types.MappingProxyType({"frame": 42})
+
+
+@pytest.fixture()
+def init_data() -> dict:
+    """
+    Pytest Fixture to return an init_data dictionary that passes validation
+
+    Returns:
+        dict: An init_data dictionary
+    """
+    return dict(_INIT_DATA)
+
+
+@pytest.fixture()
+def run_data() -> dict:
+    """
+    Pytest Fixture to return a run_data dictionary that passes validation
+
+    Returns:
+        dict: A run_data dictionary
+    """
+    return dict(_RUN_DATA)
+
+
+@pytest.fixture()
+def adaptor_mocks() -> Generator[types.SimpleNamespace, None, None]:
+    """
+    Pytest Fixture applying the patches the happy-path lifecycle tests all need:
+    AdaptorServer, LoggingSubprocess, a drained action queue and time.sleep. Replaces
+    the identical four-decorator stacks on each test.
+
+    Returns:
+        types.SimpleNamespace: The started mocks, for tests that need to tweak them
+    """
+    with ExitStack() as stack:
+        mocks = types.SimpleNamespace(
+            server=stack.enter_context(
+                patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
+            ),
+            logging_subprocess=stack.enter_context(
+                patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
+            ),
+            actions_queue_len=stack.enter_context(
+                patch(
+                    "deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__",
+                    return_value=0,
+                )
+            ),
+            sleep=stack.enter_context(patch("time.sleep")),
+        )
+        mocks.server.return_value.server_path = "/tmp/9999"
+        yield mocks
+
+
+@pytest.fixture()
+def started_adaptor(init_data: dict, adaptor_mocks: types.SimpleNamespace) -> MaxAdaptor:
+    """
+    Pytest Fixture for a MaxAdaptor that has completed on_start under the shared mocks
+
+    Returns:
+        MaxAdaptor: The started adaptor
+    """
+    adaptor = MaxAdaptor(init_data)
+    adaptor.on_start()
+    return adaptor
+
+
+@pytest.fixture()
+def post_stop_adaptor(started_adaptor: MaxAdaptor, run_data: dict) -> MaxAdaptor:
+    """
+    Pytest Fixture for a MaxAdaptor that has been run through on_run and on_stop,
+    for tests that only exercise what comes after (on_cleanup)
+
+    Returns:
+        MaxAdaptor: The stopped adaptor
+    """
+    with patch(
+        "deadline.max_adaptor.MaxAdaptor.adaptor.MaxAdaptor._is_rendering",
+        new_callable=PropertyMock,
+        return_value=False,
+    ):
+        started_adaptor.on_run(run_data)
+        started_adaptor.on_stop()
+    return started_adaptor
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import re
+import types
 from unittest.mock import Mock, PropertyMock, patch
 
 import pytest
@@ -11,80 +12,34 @@ import jsonschema  # type: ignore
 from deadline.max_adaptor.MaxAdaptor import MaxAdaptor
 from deadline.max_adaptor.MaxAdaptor.adaptor import _FIRST_MAX_ACTIONS, MaxNotRunningError
 
-
-@pytest.fixture()
-def init_data() -> dict:
-    """
-    Pytest Fixture to return an init_data dictionary that passes validation
-
-    Returns:
-        dict: An init_data dictionary
-    """
-    return {
-        # "animation": True,
-        "renderer": "Default_Scanline_Renderer",
-        "state_set": "State01",
-        "strict_error_checking": True,
-        # "version": 2022,
-        "output_file_path": "C:/workspace/deadline-cloud-for-3ds-max/test_projects/adaptor/output",
-        "scene_file": "C:/workspace/deadline-cloud-for-3ds-max/test_projects/adaptor/teapot_blank.max",
-        "camera": "Camera001",
-        "output_file_name": "output_###",
-    }
-
-
-@pytest.fixture()
-def run_data() -> dict:
-    """
-    Pytest Fixture to return a run_data dictionary that passes validation
-
-    Returns:
-        dict: A run_data dictionary
-    """
-    return {"frame": 42}
+# Compiled once per process; parametrize lists are rebuilt per collected test
+_ERROR_RE = re.compile(r"Error:")
+_WARNING_RE = re.compile(r"Warning:")
+_STRICT_ERROR_REGEXES = [re.compile("Exception:|Error:|Warning")]
 
 
 class TestMaxAdaptor_on_start:
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
-    def test_no_error(
-        self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
-        init_data: dict,
-    ) -> None:
+    def test_no_error(self, started_adaptor: MaxAdaptor) -> None:
         """Tests that on_start completes without error"""
-        adaptor = MaxAdaptor(init_data)
-        mock_server.return_value.server_path = "/tmp/9999"
-        adaptor.on_start()
 
-    @patch("time.sleep")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
     @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
     def test__wait_for_socket(
         self,
         mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
-        mock_sleep: Mock,
         init_data: dict,
     ) -> None:
-        """Tests that the _wait_for_socket method sleeps until a server path is available"""
+        """Tests that _wait_for_socket returns the server path once the server is ready"""
         # GIVEN
         adaptor = MaxAdaptor(init_data)
-        server_mock = PropertyMock(
-            side_effect=[None, None, None, "/tmp/9999", "/tmp/9999", "/tmp/9999"]
-        )
-        type(mock_server.return_value).server_path = server_mock
+        adaptor._server = mock_server
+        mock_server.server_path = "/tmp/9999"
+        adaptor._server_ready.set()
 
         # WHEN
-        adaptor.on_start()
+        server_path = adaptor._wait_for_socket()
 
         # THEN
-        assert mock_sleep.call_count == 3
+        assert server_path == "/tmp/9999"
 
     @patch("threading.Thread")
     @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
@@ -106,23 +61,14 @@ class TestMaxAdaptor_on_start:
             == "Could not find a server path because the server did not finish initializing"
         )
 
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
-    def test_max_init_timeout(
-        self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
-        init_data: dict,
-    ) -> None:
+    def test_max_init_timeout(self, init_data: dict, adaptor_mocks: types.SimpleNamespace) -> None:
         """
         Tests that a TimeoutError is raised if the max client does not complete initialization
         tasks within a given time frame
         """
         # GIVEN
         adaptor = MaxAdaptor(init_data)
-        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor_mocks.actions_queue_len.return_value = 1
         new_timeout = 0.01
 
         with (
@@ -140,22 +86,13 @@ class TestMaxAdaptor_on_start:
         assert str(exc_info.value) == error_msg
 
     @patch.object(MaxAdaptor, "_max_is_running", False)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
-    def test_max_init_fail(
-        self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
-        init_data: dict,
-    ) -> None:
+    def test_max_init_fail(self, init_data: dict, adaptor_mocks: types.SimpleNamespace) -> None:
         """
         Tests that an RuntimeError is raised if the max client encounters an exception
         """
         # GIVEN
         adaptor = MaxAdaptor(init_data)
-        mock_server.return_value.server_path = "/tmp/9999"
+        adaptor_mocks.actions_queue_len.return_value = 1
 
         with pytest.raises(RuntimeError) as exc_info:
             # WHEN
@@ -166,13 +103,10 @@ class TestMaxAdaptor_on_start:
         assert str(exc_info.value) == error_msg
 
     @patch.object(MaxAdaptor, "_action_queue")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
     def test_populate_action_queue_required_keys(
         self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
         mock_actions_queue: Mock,
+        adaptor_mocks: types.SimpleNamespace,
     ) -> None:
         """Tests that on_start completes without error"""
         mock_actions_queue.__len__.return_value = 0
@@ -187,8 +121,6 @@ class TestMaxAdaptor_on_start:
             }
         )
 
-        mock_server.return_value.server_path = "/tmp/9999"
-
         adaptor.on_start()
 
         calls = mock_actions_queue.enqueue_action.call_args_list
@@ -197,15 +129,7 @@ class TestMaxAdaptor_on_start:
             assert call.args[0].name == action_name
 
     @patch.object(MaxAdaptor, "_max_is_running", False)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__", return_value=1)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
-    def test_init_data_wrong_schema(
-        self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
-    ) -> None:
+    def test_init_data_wrong_schema(self, adaptor_mocks: types.SimpleNamespace) -> None:
         """
         Tests that an RuntimeError is raised if the max client encounters an exception
         """
@@ -223,35 +147,25 @@ class TestMaxAdaptor_on_start:
 
 
 class TestMaxAdaptor_on_run:
-    @patch("time.sleep")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
+    @patch(
+        "deadline.max_adaptor.MaxAdaptor.adaptor.MaxAdaptor._is_rendering",
+        new_callable=PropertyMock,
+    )
     def test_on_run(
-        self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
-        mock_sleep: Mock,
-        init_data: dict,
-        run_data: dict,
+        self, mock_is_rendering: Mock, started_adaptor: MaxAdaptor, run_data: dict
     ) -> None:
         """Tests that on_run completes without error, and waits"""
         # GIVEN
-        adaptor = MaxAdaptor(init_data)
-        mock_server.return_value.server_path = "/tmp/9999"
         # First side_effect value consumed by setter
-        is_rendering_mock = PropertyMock(side_effect=[None, True, False])
-        MaxAdaptor._is_rendering = is_rendering_mock
-        adaptor.on_start()
+        mock_is_rendering.side_effect = [None, True, False]
 
         # WHEN
-        adaptor.on_run(run_data)
+        with patch.object(started_adaptor._render_done_event, "wait") as mock_event_wait:
+            started_adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(0.1)
+        mock_event_wait.assert_called_once_with(0.1)
 
-    @patch("time.sleep")
     @patch(
         "deadline.max_adaptor.MaxAdaptor.adaptor.MaxAdaptor._is_rendering",
         new_callable=PropertyMock,
@@ -260,65 +174,52 @@ class TestMaxAdaptor_on_run:
         "deadline.max_adaptor.MaxAdaptor.adaptor.MaxAdaptor._max_is_running",
         new_callable=PropertyMock,
     )
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
     def test_on_run_render_fail(
         self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
         mock_max_is_running: Mock,
         mock_is_rendering: Mock,
-        mock_sleep: Mock,
         init_data: dict,
         run_data: dict,
+        adaptor_mocks: types.SimpleNamespace,
     ) -> None:
         """Tests that on_run raises an error if the render fails"""
         # GIVEN
         mock_is_rendering.side_effect = [None, True, False]
         mock_max_is_running.side_effect = [True, True, True, False, False]
-        mock_logging_subprocess.return_value.returncode = 1
+        adaptor_mocks.logging_subprocess.return_value.returncode = 1
         adaptor = MaxAdaptor(init_data)
-        mock_server.return_value.server_path = "/tmp/9999"
         adaptor.on_start()
 
         # WHEN
-        with pytest.raises(RuntimeError) as exc_info:
+        with (
+            patch.object(adaptor._render_done_event, "wait") as mock_event_wait,
+            pytest.raises(RuntimeError) as exc_info,
+        ):
             adaptor.on_run(run_data)
 
         # THEN
-        mock_sleep.assert_called_once_with(0.1)
+        mock_event_wait.assert_called_once_with(0.1)
         assert str(exc_info.value) == (
             "Max exited early and did not render successfully, please check render logs. "
             "Exit code 1"
         )
 
-    @patch("time.sleep")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
+    @patch(
+        "deadline.max_adaptor.MaxAdaptor.adaptor.MaxAdaptor._is_rendering",
+        new_callable=PropertyMock,
+    )
     def test_run_data_wrong_schema(
-        self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
-        mock_sleep: Mock,
-        init_data: dict,
+        self, mock_is_rendering: Mock, started_adaptor: MaxAdaptor
     ) -> None:
         """Tests that on_run completes without error, and waits"""
         # GIVEN
-        adaptor = MaxAdaptor(init_data)
-        mock_server.return_value.server_path = "/tmp/9999"
         # First side_effect value consumed by setter
-        is_rendering_mock = PropertyMock(side_effect=[None, True, False])
-        MaxAdaptor._is_rendering = is_rendering_mock
-        adaptor.on_start()
+        mock_is_rendering.side_effect = [None, True, False]
         run_data = {"bad": "data"}
 
         with pytest.raises(jsonschema.exceptions.ValidationError) as exc_info:
             # WHEN
-            adaptor.on_run(run_data)
+            started_adaptor.on_run(run_data)
 
         # THEN
         error_msg = " is a required property"
@@ -327,30 +228,20 @@ class TestMaxAdaptor_on_run:
 
 class TestMaxAdaptor_on_stop:
 
-    @patch("time.sleep")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
+    @patch(
+        "deadline.max_adaptor.MaxAdaptor.adaptor.MaxAdaptor._is_rendering",
+        new_callable=PropertyMock,
+        return_value=False,
+    )
     def test_on_stop(
-        self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
-        mock_sleep: Mock,
-        init_data: dict,
-        run_data: dict,
+        self, mock_is_rendering: Mock, started_adaptor: MaxAdaptor, run_data: dict
     ) -> None:
         """Tests that on_stop completes without error"""
         # GIVEN
-        adaptor = MaxAdaptor(init_data)
-        mock_server.return_value.server_path = "/tmp/9999"
-        is_rendering_mock = PropertyMock(return_value=False)
-        MaxAdaptor._is_rendering = is_rendering_mock
-        adaptor.on_start()
-        adaptor.on_run(run_data)
+        started_adaptor.on_run(run_data)
 
         # WHEN
-        adaptor.on_stop()
+        started_adaptor.on_stop()
 
 
 class TestMaxAdaptor_on_cleanup:
@@ -405,36 +296,14 @@ class TestMaxAdaptor_on_cleanup:
         mock_logger.error.assert_called_once_with("Failed to shutdown the Max Adaptor server.")
         mock_server_thread.join.assert_called_once_with(timeout=0.01)
 
-    @patch("time.sleep")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.ActionsQueue.__len__", return_value=0)
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.LoggingSubprocess")
-    @patch("deadline.max_adaptor.MaxAdaptor.adaptor.AdaptorServer")
-    def test_on_cleanup(
-        self,
-        mock_server: Mock,
-        mock_logging_subprocess: Mock,
-        mock_actions_queue: Mock,
-        mock_sleep: Mock,
-        init_data: dict,
-        run_data: dict,
-    ) -> None:
-        """Tests that on_stop completes without error"""
-        # GIVEN
-        adaptor = MaxAdaptor(init_data)
-        mock_server.return_value.server_path = "/tmp/9999"
-        is_rendering_mock = PropertyMock(return_value=False)
-        MaxAdaptor._is_rendering = is_rendering_mock
-
-        adaptor.on_start()
-        adaptor.on_run(run_data)
-        adaptor.on_stop()
-
+    def test_on_cleanup(self, post_stop_adaptor: MaxAdaptor) -> None:
+        """Tests that on_cleanup completes without error after a stopped render"""
         with patch(
             "deadline.max_adaptor.MaxAdaptor.adaptor.MaxAdaptor._max_is_running",
             new_callable=lambda: False,
         ):
             # WHEN
-            adaptor.on_cleanup()
+            post_stop_adaptor.on_cleanup()
 
     @patch("deadline.max_adaptor.MaxAdaptor.adaptor.MaxAdaptor.update_status")
     def test_handle_complete(self, mock_update_status: Mock, init_data: dict):
@@ -486,12 +355,12 @@ class TestMaxAdaptor_on_cleanup:
             (
                 "RuntimeError: Error encountered when initializing Max - Please check for "
                 "sufficient disk space and necessary write permissions of MAX_APP_DIR.",
-                re.compile(".*Error:.*"),
+                _ERROR_RE,
             ),
             (
                 "Warning: file: somefile.mel line 1: filePathEditor: Attribute 'aiVolume.filename'"
                 " is invalid or is not designated 'usedAsFilename'.",
-                re.compile(".*Warning:.*"),
+                _WARNING_RE,
             ),
         ],
     )
@@ -518,14 +387,13 @@ class TestMaxAdaptor_on_cleanup:
         # GIVEN
         init_data["strict_error_checking"] = strict_error_checking
         adaptor = MaxAdaptor(init_data)
-        error_regexes = [re.compile(".*Exception:.*|.*Error:.*|.*Warning.*")]
 
         # WHEN
         callbacks = adaptor._get_regex_callbacks()
 
         # THEN
         assert (
-            any(error_regexes == regex_callback.regex_list for regex_callback in callbacks)
+            any(_STRICT_ERROR_REGEXES == regex_callback.regex_list for regex_callback in callbacks)
             == strict_error_checking
         )
 
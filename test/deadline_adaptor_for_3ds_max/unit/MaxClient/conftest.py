@@ -0,0 +1,11 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+import sys
+from unittest.mock import MagicMock
+
+# The MaxClient modules import pymxs at module level, which only exists inside
+# 3ds Max. Installing the mock here, instead of in unit/__init__.py, keeps the
+# MagicMock construction off the import path of tests that never touch pymxs.
+# conftest modules are imported before the test modules in this directory are
+# collected, so the mock is in place before the first MaxClient import.
+sys.modules.setdefault("pymxs", MagicMock())